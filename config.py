@@ -264,6 +264,7 @@ class AppConstants:
     
     # Performance settings
     TARGET_FPS = 30
+    MAX_FRAME_DT = 0.1  # seconds; longer stalls are simulated as this much time
     PYGAME_FLAGS = "NOFRAME | SRCALPHA"
     
     # Mouse interaction
@@ -15,6 +15,8 @@ from typing import List, Tuple, Optional, Dict, Any, TYPE_CHECKING
 
 from config import AppConstants, get_config
 from sprite_loader import get_sprite_loader
+from pet_behavior import flush_debug_log
+from utils.physics import boundary_contacts
 
 if TYPE_CHECKING:
     from pet_behavior import DesktopPet
@@ -28,7 +30,7 @@ class BoundaryManager:
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.config = config_manager
-        self.boundaries = self._calculate_boundaries()
+        self.update_boundaries()
     
     def _calculate_boundaries(self) -> Dict[str, int]:
         """Calculate boundary positions from config percentages"""
@@ -37,6 +39,13 @@ class BoundaryManager:
     def update_boundaries(self) -> None:
         """Recalculate boundaries when config changes"""
         self.boundaries = self._calculate_boundaries()
+        # Plain attributes for the per-frame pet code (no string-keyed lookups)
+        self.left_wall_x = self.boundaries['left_wall_x']
+        self.right_wall_x = self.boundaries['right_wall_x']
+        self.ground_y = self.boundaries['ground_y']
+        self.ceiling_y = self.boundaries['ceiling_y']
+        # (left, right, ceiling, ground) for the quick "touching nothing" test
+        self.interior = (self.left_wall_x, self.right_wall_x, self.ceiling_y, self.ground_y)
     
     def get_playable_area(self) -> Dict[str, int]:
         """Get the playable area dimensions"""
@@ -58,6 +67,11 @@ class BoundaryManager:
             'ceiling': y <= self.boundaries['ceiling_y']
         }
     
+    def check_boundary_contacts(self, x: float, y: float, width: int, height: int) -> int:
+        """Same check as check_boundary_collision, as a utils.physics HIT_* bitmask"""
+        return boundary_contacts(x, y, width, height, self.left_wall_x, self.right_wall_x,
+                                 self.ceiling_y, self.ground_y)
+    
     def clamp_to_boundaries(self, x: float, y: float, width: int, height: int) -> Tuple[float, float]:
         """Clamp position to stay within boundaries"""
         # Clamp X position
@@ -168,12 +182,12 @@ class PygameWindow:
         self.pets: List['DesktopPet'] = []
         self.clock = pygame.time.Clock()
         self.running = True
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.monotonic()
         
         # Performance tracking
         self.frame_count = 0
         self.fps_counter = 0.0
-        self.last_fps_update = time.time()
+        self.last_fps_update = time.monotonic()
 
         # Mouse tracking
         self.last_mouse_pos: Optional[Tuple[int, int]] = None
@@ -271,6 +285,23 @@ class PygameWindow:
         if setting_name.startswith('physics_'):
             for pet in self.pets:
                 pet.update_physics_parameters()
+
+        # Refresh cached config flags on all pets
+        if setting_name in ('debug_mode', 'show_stats', 'screen_boundaries', 'wall_climbing_enabled'):
+            for pet in self.pets:
+                pet.refresh_config_cache()
+        
+        # Warm up the newly selected sprite so the next spawn doesn't hit the disk
+        if setting_name == 'selected_sprite':
+            threading.Thread(target=self._warm_sprite_asset, args=(value,), daemon=True).start()
+    
+    def _warm_sprite_asset(self, sprite_name: str) -> None:
+        """Bangun shared AnimationAsset di background (tidak memblokir control panel)"""
+        try:
+            from utils.animation import get_animation_asset
+            get_animation_asset(sprite_name)
+        except Exception as e:
+            print(f"Error warming sprite {sprite_name}: {e}")
     
     def add_pet(self, sprite_name: str, x: Optional[int] = None, y: Optional[int] = None) -> str:
         """Add new pet"""
@@ -332,7 +363,19 @@ class PygameWindow:
         except:
             pass
 
+        # Coalesce mouse motion: only the latest position per frame matters
+        pending_motion = None
+        
         for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                pending_motion = event.pos
+                continue
+            
+            # Apply pending motion first so clicks see the up-to-date position
+            if pending_motion is not None and event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                self._handle_mouse_motion(pending_motion)
+                pending_motion = None
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -342,11 +385,11 @@ class PygameWindow:
             elif event.type == pygame.MOUSEBUTTONUP:
                 self._handle_mouse_up(event.button, self.mouse_dx, self.mouse_dy)
             
-            elif event.type == pygame.MOUSEMOTION:
-                self._handle_mouse_motion(event.pos)
-            
             elif event.type == pygame.KEYDOWN:
                 self._handle_key_down(event.key)
+        
+        if pending_motion is not None:
+            self._handle_mouse_motion(pending_motion)
     
     def _handle_mouse_down(self, pos: Tuple[int, int], button: int) -> None:
         """Handle mouse down"""
@@ -376,30 +419,36 @@ class PygameWindow:
         elif key == pygame.K_F1:
             debug_mode = self.config.get('settings.debug_mode', False)
             self.config.set('settings.debug_mode', not debug_mode)
+            for pet in self.pets:
+                pet.refresh_config_cache()
             print(f"Debug mode: {not debug_mode}")
         elif key == pygame.K_F2:
             self._print_performance_info()
     
     def update(self) -> None:
         """Update game logic"""
-        current_time = time.time()
-        dt = current_time - self.last_frame_time
+        # One monotonic timestamp per frame, shared by all pets
+        current_time = time.monotonic()
+        # Clamp so an OS stall doesn't make pets tunnel through walls
+        dt = min(current_time - self.last_frame_time, AppConstants.MAX_FRAME_DT)
         self.last_frame_time = current_time
         
         # Update all pets
         for pet in self.pets[:]:
-            pet.update(dt, (self.screen_width, self.screen_height))
+            pet.update(dt, (self.screen_width, self.screen_height), current_time)
         
         # Remove dead pets
         self.pets = [pet for pet in self.pets if pet.running]
         
+        # Write this frame's debug traces in one go
+        flush_debug_log()
+        
         # Update performance
-        self._update_performance_counters(dt)
+        self._update_performance_counters(current_time)
     
-    def _update_performance_counters(self, dt: float) -> None:
+    def _update_performance_counters(self, current_time: float) -> None:
         """Update FPS counter"""
         self.frame_count += 1
-        current_time = time.time()
         
         if current_time - self.last_fps_update >= 1.0:
             self.fps_counter = self.frame_count / (current_time - self.last_fps_update)
@@ -411,17 +460,25 @@ class PygameWindow:
         # Clear dengan black (transparent di tkinter)
         self.screen.fill((0, 0, 0))  # Black = transparent
         
+        debug_mode = self.config.get('settings.debug_mode', False)
+        
         # Draw boundaries if debug mode is enabled
-        if self.config.get('settings.debug_mode', False):
+        if debug_mode:
             self.boundary_manager.draw_boundaries(self.screen)
             self.boundary_manager._draw_corner_indicators(self.screen)
         
-        # Draw all pets
+        # Draw all on-screen pet sprites in one batched blit
+        screen_rect = self.screen.get_rect()
+        self.screen.blits([(pet.image, pet.rect) for pet in self.pets
+                           if pet.image and screen_rect.colliderect(pet.rect)], doreturn=False)
+        
+        # Per-pet overlays only needed for debug info or missing sprites
         for pet in self.pets:
-            pet.draw(self.screen)
+            if debug_mode or not pet.image:
+                pet.draw_overlays(self.screen)
         
         # Draw debug overlay if debug mode is enabled
-        if self.config.get('settings.debug_mode', False):
+        if debug_mode:
             self._draw_debug_overlay()
         
         # Update display
@@ -7,14 +7,21 @@ with the existing physics and animation system.
 """
 
 import pygame
+import sys
+import math
 import time
 import random
-from typing import Optional, Tuple, Dict, Any, List, TYPE_CHECKING
+import collections
+import itertools
+import logging
+from types import MappingProxyType
+from typing import Optional, Tuple, Dict, Any, List, Sequence, TYPE_CHECKING
 from enum import Enum
-from dataclasses import dataclass
 
 from config import AppConstants, get_config
 from sprite_loader import get_sprite_loader
+from utils.physics import (integrate_motion, clamp_bounce, HIT_LEFT_WALL, HIT_WALLS,
+                           HIT_GROUND, HIT_CEILING)
 
 if TYPE_CHECKING:
     from gui_manager import BoundaryManager
@@ -33,6 +40,57 @@ except ImportError:
         return None
 
 
+# Ring buffer untuk debug trace (menggantikan print per-event yang blocking di console)
+_DEBUG_LOG: collections.deque = collections.deque(maxlen=256)
+_PENDING_LOG: collections.deque = collections.deque(maxlen=256)  # Belum ditulis ke stdout
+
+
+class _RingBufferHandler(logging.Handler):
+    """Logging handler yang menyimpan pesan ke ring buffer, bukan langsung ke stdout"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        message = self.format(record)
+        _DEBUG_LOG.append(message)
+        _PENDING_LOG.append(message)
+
+
+# Module logger; level diatur dari settings.debug_mode (lihat refresh_config_cache)
+log = logging.getLogger(__name__)
+log.addHandler(_RingBufferHandler())
+log.setLevel(logging.WARNING)
+
+
+def flush_debug_log() -> None:
+    """Tulis semua pesan log frame ini ke stdout dengan satu write"""
+    if _PENDING_LOG:
+        sys.stdout.write("\n".join(_PENDING_LOG) + "\n")
+        _PENDING_LOG.clear()
+
+
+def get_debug_log() -> List[str]:
+    """Get pesan debug terbaru (paling lama dulu)"""
+    return list(_DEBUG_LOG)
+
+
+# Bound method RNG global, dipanggil berkali-kali per decision tick
+_random = random.random
+_uniform = random.uniform
+
+
+def _animation_always_completed() -> bool:
+    """Default is_animation_completed saat animation system tidak aktif"""
+    return True
+
+
+def _animation_play_unavailable(action_name: str, loop: bool = True) -> bool:
+    """Default play_action saat animation system tidak aktif"""
+    return False
+
+
+def _animation_set_facing_noop(facing_right: bool) -> None:
+    """Default set_facing_direction saat animation system tidak aktif"""
+
+
 class PetState(Enum):
     """Pet behavioral states yang sesuai dengan XML actions"""
     # Basic states
@@ -61,26 +119,165 @@ class PetState(Enum):
     WATCH = "WatchAction"
 
 
-@dataclass
+# Lookup XML action name -> PetState tanpa exception saat tidak ditemukan
+_STATE_BY_VALUE: Dict[str, PetState] = {state.value: state for state in PetState}
+
+# State groups untuk membership check yang sering dipanggil
+_LOOPING_STATES = frozenset({
+    PetState.IDLE, PetState.WALKING, PetState.RUNNING, PetState.SITTING,
+    PetState.GRAB_WALL, PetState.GRAB_CEILING, PetState.CLIMB_WALL, PetState.BOUNCING,
+})
+_MOVING_STATES = frozenset({PetState.WALKING, PetState.RUNNING})
+_AIRBORNE_STATES = frozenset({PetState.FALLING, PetState.THROWN})
+_FREEFALL_STATES = frozenset({PetState.FALLING, PetState.THROWN, PetState.BOUNCING})
+_WALL_STATES = frozenset({PetState.GRAB_WALL, PetState.CLIMB_WALL})
+_SPECIAL_STATES = frozenset({PetState.POSE, PetState.EAT_BERRY, PetState.THROW_NEEDLE, PetState.WATCH})
+_RESTING_STATES = frozenset({PetState.SITTING, PetState.IDLE, PetState.GRAB_WALL})
+
+# Sprite pairs untuk fallback animation (tanpa XML), IDLE dan state lain pakai default
+_DEFAULT_FALLBACK_FRAMES = ("shime1.png", "shime1a.png")
+_FALLBACK_FRAMES: Dict[PetState, Tuple[str, str]] = {
+    PetState.WALKING: ("shime2.png", "shime3.png"),
+    PetState.SITTING: ("shime11.png", "shime11a.png"),
+    PetState.RUNNING: ("shime3e.png", "shime3f.png"),
+    **{state: ("shime4.png", "shime4.png") for state in _AIRBORNE_STATES},
+    **{state: ("shime13.png", "shime13a.png") for state in _WALL_STATES},  # Wall grab sprites
+}
+
+# Weighted actions untuk _decide_next_action, satu group per kondisi:
+# energy > 30, energy < 70, happiness > 50, dekat dinding, random 10% roll
+_ACTION_WEIGHT_GROUPS = (
+    ((PetState.WALKING, 40), (PetState.RUNNING, 20)),
+    ((PetState.SITTING, 30),),
+    ((PetState.POSE, 15), (PetState.EAT_BERRY, 10), (PetState.WATCH, 20)),
+    ((PetState.GRAB_WALL, 25),),
+    ((PetState.THROW_NEEDLE, 5),),
+)
+
+
+def _build_alias_table(weights: Sequence[int]) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """Vose alias method: (prob, alias) supaya weighted pick jadi O(1)
+
+    Draw: i = int(random() * n); pakai i jika random() < prob[i], selain itu alias[i].
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [weight * n / total for weight in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    
+    while small and large:
+        less = small.pop()
+        more = large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] += scaled[less] - 1.0
+        (small if scaled[more] < 1.0 else large).append(more)
+    
+    # Sisa di salah satu list bernilai ~1.0 (floating point), prob tetap 1.0
+    return tuple(prob), tuple(alias)
+
+
+def _build_action_tables() -> Dict[Tuple[bool, ...], Tuple[Tuple[PetState, ...], Tuple[float, ...], Tuple[PetState, ...]]]:
+    """Precompute (states, prob, alias states) untuk setiap kombinasi kondisi"""
+    tables = {}
+    for key in itertools.product((False, True), repeat=len(_ACTION_WEIGHT_GROUPS)):
+        states = []
+        weights = []
+        for enabled, group in zip(key, _ACTION_WEIGHT_GROUPS):
+            if enabled:
+                for state, weight in group:
+                    states.append(state)
+                    weights.append(weight)
+        if states:
+            prob, alias = _build_alias_table(weights)
+            tables[key] = (tuple(states), prob, tuple(states[i] for i in alias))
+        else:
+            tables[key] = ((), (), ())
+    return tables
+
+
+_ACTION_TABLES = _build_action_tables()
+
+
 class PetStats:
-    """Pet statistics dengan system yang lebih detailed"""
-    health: float = 100.0
-    happiness: float = 100.0
-    energy: float = 100.0
-    last_interaction: float = 0.0
-    total_interactions: int = 0
-    time_in_current_state: float = 0.0
-    
-    # Behavioral counters
-    walks_taken: int = 0
-    times_petted: int = 0
-    special_actions_performed: int = 0
-    wall_climbs: int = 0  # NEW: wall climbing counter
+    """Pet statistics dengan system yang lebih detailed
+    
+    Plain class dengan __slots__ (bukan dataclass) supaya tiap pet tidak
+    membawa __dict__ sendiri; field dibaca setiap frame di update loop.
+    """
+    __slots__ = (
+        'health', 'happiness', 'energy', 'last_interaction', 'total_interactions',
+        'time_in_current_state', 'walks_taken', 'times_petted',
+        'special_actions_performed', 'wall_climbs',
+    )
+    
+    def __init__(self, health: float = 100.0, happiness: float = 100.0, energy: float = 100.0,
+                 last_interaction: float = 0.0, total_interactions: int = 0,
+                 time_in_current_state: float = 0.0, walks_taken: int = 0,
+                 times_petted: int = 0, special_actions_performed: int = 0,
+                 wall_climbs: int = 0):
+        self.health = health
+        self.happiness = happiness
+        self.energy = energy
+        self.last_interaction = last_interaction
+        self.total_interactions = total_interactions
+        self.time_in_current_state = time_in_current_state
+        
+        # Behavioral counters
+        self.walks_taken = walks_taken
+        self.times_petted = times_petted
+        self.special_actions_performed = special_actions_performed
+        self.wall_climbs = wall_climbs  # NEW: wall climbing counter
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"PetStats({fields})"
 
 
 class DesktopPet:
     """Enhanced desktop pet dengan boundary system integration"""
     
+    # Behavior timing (seconds)
+    IDLE_DECISION_DELAY = 3.0       # Idle pets pick a new action after this long
+    BEHAVIOR_TICK_INTERVAL = 2.0    # Behavioral AI rolls for an action this often
+    STATS_UPDATE_INTERVAL = 0.25    # Stats decay/restore is applied in batches
+    
+    # Shared debug overlay resources (dibuat sekali, dipakai semua pet)
+    _FONTS: Dict[int, pygame.font.Font] = {}
+    _STATE_LABELS: Dict[Tuple[PetState, int], pygame.Surface] = {}
+    _TEXT_CACHE: Dict[Tuple[str, int, Tuple[int, int, int]], pygame.Surface] = {}
+    TEXT_CACHE_SIZE = 64            # Max rendered debug labels kept (shared by all pets)
+    
+    # Facing arrow vertex offsets relative to rect right/left edge and top
+    _ARROW_RIGHT = ((-10, 5), (-5, 10), (-10, 15))
+    _ARROW_LEFT = ((10, 5), (5, 10), (10, 15))
+    
+    # Right-click special actions (GRAB_WALL only when wall climbing is available)
+    _SPECIAL_ACTIONS: Tuple[PetState, ...] = (
+        PetState.POSE, PetState.EAT_BERRY, PetState.WATCH, PetState.THROW_NEEDLE,
+    )
+    _SPECIAL_ACTIONS_WITH_WALL: Tuple[PetState, ...] = _SPECIAL_ACTIONS + (PetState.GRAB_WALL,)
+    
+    # Attributes persisted by save_state (state dan stats ditangani terpisah)
+    _SAVE_FIELDS: Tuple[str, ...] = (
+        'pet_id', 'sprite_name', 'x', 'y', 'target_x', 'target_y',
+        'facing_right', 'velocity_x', 'velocity_y', 'on_ground', 'on_wall',
+        'wall_side', 'gravity_enabled', 'running',
+    )
+    _STATS_FIELDS: Tuple[str, ...] = (
+        'health', 'happiness', 'energy', 'total_interactions', 'walks_taken',
+        'times_petted', 'special_actions_performed', 'wall_climbs',
+    )
+    
+    # Constant fields of get_performance_info
+    _PERFORMANCE_TEMPLATE = MappingProxyType({
+        'update_frequency': '30 FPS target',
+        'memory_footprint': 'Light (sprites cached)',
+    })
+    
     def __init__(self, sprite_name: str, x: int = 100, y: int = 100, pet_id: str = None):
         self.sprite_name = sprite_name
         self.pet_id = pet_id or f"{sprite_name}_{int(time.time())}_{random.randint(1000, 9999)}"
@@ -97,11 +294,11 @@ class DesktopPet:
         self.state = PetState.IDLE
         self.previous_state = PetState.IDLE
         self.state_timer = 0.0
-        self.state_duration = 0.0
         
         # NEW: Walk duration tracking
         self.walk_duration = 0.0
         self.walk_start_time = 0.0
+        self.walk_deadline = 0.0  # state_timer value at which the current walk ends
         
         # NEW: Boundary system integration
         self.boundary_manager: Optional['BoundaryManager'] = None
@@ -110,11 +307,8 @@ class DesktopPet:
         self.wall_climb_timer = 0.0
         
         # NEW: Collision prevention system
-        self.last_collision_time = 0.0
-        self.collision_cooldown = 0.5  # Minimum time between collisions
         self.direction_lock_timer = 0.0
         self.direction_lock_duration = 0.3  # Lock direction for this duration
-        self.last_wall_side = None
         
         # Enhanced direction change cooldown to prevent glitches
         self.direction_change_cooldown = 0.5  # seconds
@@ -126,11 +320,11 @@ class DesktopPet:
             try:
                 self.animation_manager = create_animation_manager(sprite_name)
                 if self.animation_manager:
-                    print(f"Animation system loaded for {sprite_name}")
+                    log.debug("Animation system loaded for %s", sprite_name)
                 else:
-                    print(f"Warning: Failed to create animation manager for {sprite_name}")
+                    log.warning("Failed to create animation manager for %s", sprite_name)
             except Exception as e:
-                print(f"Error creating animation manager: {e}")
+                log.warning("Error creating animation manager: %s", e)
                 self.animation_manager = None
         
         # Interaction handling
@@ -138,7 +332,6 @@ class DesktopPet:
         self.drag_offset_x = 0
         self.drag_offset_y = 0
         self.last_click_time = 0
-        self.click_count = 0
         
         # Pet properties
         self.stats = PetStats()
@@ -149,19 +342,21 @@ class DesktopPet:
         # Configuration and Physics parameters
         self.config = get_config()
         self.update_physics_parameters()
+        self.refresh_config_cache()
         
         # Behavioral properties
         self.behavior_timer = 0.0
-        self.idle_timer = 0.0
-        self.action_queue = []
+        self.stats_timer = 0.0  # Accumulated dt not yet applied to stats
+        self.last_update_time = time.monotonic()  # Frame timestamp from update()
         
         # Sprite and rendering
         self.sprite_loader = get_sprite_loader()
         self.current_sprite = None
-        self.current_velocity = (0.0, 0.0)
         self.current_sprite_name = AppConstants.SPRITE_REQUIRED_FILE
         self.animation_frame = 0
         self.animation_timer = 0.0
+        self._stats_overlay_surf: Optional[pygame.Surface] = None
+        self._stats_overlay_key: tuple = ()
         
         # Load initial sprite
         self.image = self._load_current_sprite()
@@ -175,12 +370,26 @@ class DesktopPet:
         # Lifecycle management
         self.running = True
         
-        print(f"Enhanced pet created: {self.pet_id} at ({x}, {y})")
+        # Cache info animasi untuk debug info (lihat _get_animation_info)
+        self._anim_info_cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        
+        log.debug("Enhanced pet created: %s at (%s, %s)", self.pet_id, x, y)
 
+    @property
+    def facing_right(self) -> bool:
+        """Arah hadap pet"""
+        return self._facing_right
+    
+    @facing_right.setter
+    def facing_right(self, value: bool) -> None:
+        # Keep the movement sign in sync so the per-frame path can multiply instead of branch
+        self._facing_right = bool(value)
+        self._facing_sign = 1.0 if self._facing_right else -1.0
+    
     def set_boundary_manager(self, boundary_manager: 'BoundaryManager') -> None:
         """Set the boundary manager for collision detection"""
         self.boundary_manager = boundary_manager
-        print(f"Pet {self.pet_id} connected to boundary system")
+        log.debug("Pet %s connected to boundary system", self.pet_id)
 
     def update_physics_parameters(self) -> None:
         """Updates physics parameters from the global config."""
@@ -189,18 +398,29 @@ class DesktopPet:
         self.BOUNCE_COEFFICIENT = self.config.get('settings.physics_bounce_coefficient', 0.2)
         self.MIN_BOUNCE_VELOCITY = self.config.get('settings.physics_min_bounce_velocity', 100)
         self.DRAG_THROW_MULTIPLIER = self.config.get('settings.physics_drag_throw_multiplier', 6.0)
+        # Air resistance is tuned as a per-frame factor at TARGET_FPS; as a decay rate per
+        # second it can be applied as exp(rate * dt), independent of the actual frame rate
+        self._air_decay_rate = AppConstants.TARGET_FPS * math.log(1 - self.AIR_RESISTANCE_FACTOR)
+    
+    def refresh_config_cache(self) -> None:
+        """Cache config flags yang dicek di hot path (panggil lagi saat setting berubah)"""
+        self._debug = bool(self.config.get('settings.debug_mode', False))
+        log.setLevel(logging.DEBUG if self._debug else logging.WARNING)
+        self._show_stats = bool(self.config.get('settings.show_stats', False))
+        self._screen_boundaries = bool(self.config.get('settings.screen_boundaries', True))
+        self._wall_climbing_enabled = bool(self.config.get('boundaries.wall_climbing_enabled', True))
     
     def _load_current_sprite(self) -> pygame.Surface:
         """Load current sprite image dengan error handling"""
         try:
-            sprite = self.sprite_loader.load_sprite(self.sprite_name, self.current_sprite_name)
-            return sprite
+            # Flipped variant di-cache oleh sprite loader
+            if not self.facing_right:
+                return self.sprite_loader.load_sprite_flipped(self.sprite_name, self.current_sprite_name)
+            return self.sprite_loader.load_sprite(self.sprite_name, self.current_sprite_name)
         except Exception as e:
-            print(f"Error loading sprite for pet {self.pet_id}: {e}")
-            # Return fallback sprite
-            fallback = pygame.Surface(AppConstants.DEFAULT_SPRITE_SIZE, pygame.SRCALPHA)
-            fallback.fill((255, 100, 100, 200))
-            return fallback
+            log.warning("Error loading sprite for pet %s: %s", self.pet_id, e)
+            # Fallback sprite di-cache oleh sprite loader, tidak dialokasi ulang per frame
+            return self.sprite_loader.get_fallback_sprite()
     
     def _initialize_animation(self) -> None:
         """Initialize animation system dengan fallback"""
@@ -210,15 +430,41 @@ class DesktopPet:
                 if success:
                     self.animation_manager.set_facing_direction(not self.facing_right)
                     available_actions = self.animation_manager.get_available_actions()
-                    print(f"Available animations for {self.sprite_name}: {len(available_actions)} actions")
+                    log.debug("Available animations for %s: %d actions", self.sprite_name, len(available_actions))
                 else:
-                    print(f"Warning: Could not start initial animation for {self.sprite_name}")
+                    log.warning("Could not start initial animation for %s", self.sprite_name)
             except Exception as e:
-                print(f"Error initializing animation: {e}")
+                log.warning("Error initializing animation: %s", e)
                 self.animation_manager = None
+        
+        self._bind_animation_hooks()
     
-    def update(self, dt: float, screen_bounds: Tuple[int, int]) -> None:
-        """Enhanced update method with direction lock timer and improved wall climbing"""
+    def _bind_animation_hooks(self) -> None:
+        """Bind method animation manager yang dipanggil tiap frame (sekali saja)"""
+        if self.animation_manager:
+            self._anim_update = self.animation_manager.update
+            self._anim_is_completed = self.animation_manager.is_animation_completed
+            self._anim_play = self.animation_manager.play_action
+            self._anim_set_facing = self.animation_manager.set_facing_direction
+        else:
+            self._anim_update = None
+            self._anim_is_completed = _animation_always_completed
+            self._anim_play = _animation_play_unavailable
+            self._anim_set_facing = _animation_set_facing_noop
+    
+    def _disable_animation(self, error: Exception) -> None:
+        """Matikan animation manager yang error, lanjut dengan fallback animation"""
+        log.warning("Animation update error, switching to fallback animation: %s", error)
+        self.animation_manager = None
+        self._bind_animation_hooks()
+    
+    def update(self, dt: float, screen_bounds: Tuple[int, int], now: Optional[float] = None) -> None:
+        """Enhanced update method with direction lock timer and improved wall climbing
+        
+        `now` is a time.monotonic() timestamp shared by all pets in the frame.
+        """
+        self.last_update_time = time.monotonic() if now is None else now
+        
         # Update timers
         self.state_timer += dt
         self.behavior_timer += dt
@@ -229,6 +475,12 @@ class DesktopPet:
         self.rect.x = int(self.x)
         self.rect.y = int(self.y)
         
+        # Resting pets only need their idle animation until the next decision is due
+        if self._is_resting():
+            self._update_resting_animation(dt)
+            self._tick_stats(dt)
+            return
+        
         # Update movement with boundaries
         self._update_movement_with_boundaries(dt, screen_bounds)
         
@@ -239,7 +491,43 @@ class DesktopPet:
         self._update_behavioral_ai(dt)
         
         # Update stats
-        self._update_stats(dt)
+        self._tick_stats(dt)
+    
+    def _is_resting(self) -> bool:
+        """Check if pet is idle on the ground with nothing to simulate this frame"""
+        if (self.state is not PetState.IDLE or not self.on_ground or self.on_wall or self.dragging
+                or self.velocity_x != 0 or self.velocity_y != 0 or not self.boundary_manager):
+            return False
+        
+        # Wake up as soon as either decision timer is due
+        if (self.state_timer > self.IDLE_DECISION_DELAY or
+                self.behavior_timer > self.BEHAVIOR_TICK_INTERVAL):
+            return False
+        
+        # Must be standing exactly on the ground and clear of both walls
+        bounds = self.boundary_manager
+        return (self.y == bounds.ground_y - self.rect.height and
+                bounds.left_wall_x < self.x and
+                self.x + self.rect.width < bounds.right_wall_x)
+    
+    def _update_resting_animation(self, dt: float) -> None:
+        """Advance idle animation without running physics"""
+        if self._anim_update is not None:
+            try:
+                current_sprite, _ = self._anim_update(dt)
+            except Exception as e:
+                self._disable_animation(e)
+                self._update_fallback_animation(dt)
+                return
+            if current_sprite:
+                self.image = current_sprite
+    
+    def _tick_stats(self, dt: float) -> None:
+        """Accumulate frame time and apply stats changes in batches"""
+        self.stats_timer += dt
+        if self.stats_timer >= self.STATS_UPDATE_INTERVAL:
+            self._update_stats(self.stats_timer)
+            self.stats_timer = 0.0
     
     def _update_movement_with_boundaries(self, dt: float, screen_bounds: Tuple[int, int]) -> None:
         """Enhanced movement with boundary collision detection and wall climbing"""
@@ -251,87 +539,80 @@ class DesktopPet:
         prev_x = self.x
         prev_y = self.y
         
-        # Update position based on current state
-        if self.state == PetState.DRAGGING:
-            # While dragging, only update position if not wall-stuck
-            if not self.on_wall:
-                # Normal drag movement - position is set by mouse motion
-                pass
+        # While dragging the position is set by mouse motion, so no gravity or drag
+        if self.state is PetState.DRAGGING:
+            gravity = 0.0
+            damping = 1.0
         else:
-            # Apply velocity and gravity
-            if self.gravity_enabled:
-                self.velocity_y += self.GRAVITY_ACCELERATION * dt
-            
-            # Apply air resistance
-            self.velocity_x *= (1 - self.AIR_RESISTANCE_FACTOR)
-            self.velocity_y *= (1 - self.AIR_RESISTANCE_FACTOR)
-        
-        # Update position
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
-        
-        # Check boundary collisions
-        collision = self.boundary_manager.check_boundary_collision(
-            self.x, self.y, self.rect.width, self.rect.height
-        )
-        
-        # Handle collisions
-        self._handle_boundary_collisions(collision, prev_x, prev_y)
+            gravity = self.GRAVITY_ACCELERATION if self.gravity_enabled else 0.0
+            damping = math.exp(self._air_decay_rate * dt)
+        
+        # Apply velocity, gravity, air resistance and update position
+        x, y, vx, vy = integrate_motion(prev_x, prev_y, self.velocity_x, self.velocity_y,
+                                        dt, gravity, damping)
+        self.x, self.y, self.velocity_x, self.velocity_y = x, y, vx, vy
+        
+        # Check boundary collisions (skipped while the pet is clear of every boundary)
+        rect = self.rect
+        width, height = rect.width, rect.height
+        left, right, ceiling, ground = self.boundary_manager.interior
+        if not (left < x and x + width < right and ceiling < y and y + height < ground):
+            contacts = self.boundary_manager.check_boundary_contacts(x, y, width, height)
+            self._handle_boundary_collisions(contacts, prev_x, prev_y)
         
         # Update animation
-        if self.animation_manager:
+        if self._anim_update is not None:
             try:
-                current_sprite, velocity = self.animation_manager.update(dt)
+                current_sprite, velocity = self._anim_update(dt)
+            except Exception as e:
+                # Broken manager is latched off; no per-frame retry
+                self._disable_animation(e)
+                self._update_fallback_animation(dt)
+            else:
                 # Update the displayed sprite
                 if current_sprite:
                     self.image = current_sprite
                 # Apply animation velocity if not dragging, with direction awareness
-                if self.state != PetState.DRAGGING:
+                if self.state is not PetState.DRAGGING:
                     # Apply velocity based on facing direction
-                    # If facing right, invert the X velocity from animation (which is hardcoded to left)
-                    velocity_x = velocity[0] * dt
-                    if self.facing_right and velocity[0] != 0:
-                        velocity_x = -velocity[0] * dt  # Invert for right-facing movement
-                    
-                    self.velocity_x += velocity_x
-                    self.velocity_y += velocity[1] * dt
-            except Exception as e:
-                print(f"Animation update error: {e}")
-                self._update_fallback_animation(dt)
-        
-        # Update stats
-        self._update_stats(dt)
+                    # Animation X velocity is hardcoded to left, so it is inverted for right-facing movement
+                    anim_vx, anim_vy = velocity
+                    self.velocity_x -= anim_vx * self._facing_sign * dt
+                    self.velocity_y += anim_vy * dt
     
-    def _handle_boundary_collisions(self, collision: Dict[str, bool], prev_x: float, prev_y: float) -> None:
-        """Enhanced boundary collision handling with wall climbing and drag support"""
-        wall_climbing_enabled = self.config.get('boundaries.wall_climbing_enabled', True)
+    def _handle_boundary_collisions(self, contacts: int, prev_x: float, prev_y: float) -> None:
+        """Enhanced boundary collision handling with wall climbing and drag support
+        
+        `contacts` is a utils.physics HIT_* bitmask from check_boundary_contacts.
+        """
+        wall_climbing_enabled = self._wall_climbing_enabled
         
         # Handle wall collisions
-        if collision['left_wall'] or collision['right_wall']:
-            side = 'left' if collision['left_wall'] else 'right'
+        if contacts & HIT_WALLS:
+            side = 'left' if contacts & HIT_LEFT_WALL else 'right'
             self._handle_wall_collision(side, wall_climbing_enabled)
         
         # Handle ground collision
-        if collision['ground']:
+        if contacts & HIT_GROUND:
             self._handle_ground_collision()
         
         # Handle ceiling collision (for future use)
-        if collision['ceiling']:
+        if contacts & HIT_CEILING:
             self._handle_ceiling_collision()
         
         # Special handling for drag + wall collision
-        if self.state == PetState.DRAGGING and (collision['left_wall'] or collision['right_wall']):
-            side = 'left' if collision['left_wall'] else 'right'
+        if self.state is PetState.DRAGGING and contacts & HIT_WALLS:
+            side = 'left' if contacts & HIT_LEFT_WALL else 'right'
             self._handle_drag_wall_collision(side)
     
     def _handle_wall_bounce(self, side: str) -> None:
         """Handle simple wall bounce when pet is on ground"""
-        boundaries = self.boundary_manager.boundaries
+        bounds = self.boundary_manager
         
         if side == 'left':
-            self.x = boundaries['left_wall_x']
+            self.x = bounds.left_wall_x
         else:  # right
-            self.x = boundaries['right_wall_x'] - self.rect.width
+            self.x = bounds.right_wall_x - self.rect.width
         
         # Simple bounce physics
         self.velocity_x *= -self.BOUNCE_COEFFICIENT
@@ -339,23 +620,23 @@ class DesktopPet:
             self.velocity_x = 0
         
         self._change_direction()
-        print(f"Pet {self.pet_id} bounced off {side} wall while on ground")
+        log.debug("Pet %s bounced off %s wall while on ground", self.pet_id, side)
     
     def _handle_wall_collision(self, side: str, wall_climbing_enabled: bool) -> None:
         """Enhanced wall collision handling with proper wall climbing and drag support"""
         if not self.boundary_manager:
             return
         
-        boundaries = self.boundary_manager.boundaries
+        bounds = self.boundary_manager
         
         # Position pet exactly on the wall
         if side == 'left':
-            self.x = boundaries['left_wall_x']
+            self.x = bounds.left_wall_x
         else:  # right
-            self.x = boundaries['right_wall_x'] - self.rect.width
+            self.x = bounds.right_wall_x - self.rect.width
         
         # Handle wall climbing logic
-        if wall_climbing_enabled and self.state not in [PetState.DRAGGING] and not self.on_ground:
+        if wall_climbing_enabled and self.state is not PetState.DRAGGING and not self.on_ground:
             # Start wall climbing if moving towards wall or already on wall
             if (side == 'left' and self.velocity_x < 0) or (side == 'right' and self.velocity_x > 0) or self.on_wall:
                 self.on_wall = True
@@ -365,11 +646,11 @@ class DesktopPet:
                 self.velocity_x = 0
                 
                 # Start climbing animation if not already climbing
-                if self.state != PetState.CLIMB_WALL:
+                if self.state is not PetState.CLIMB_WALL:
                     self.change_state(PetState.GRAB_WALL)
                     self.stats.wall_climbs += 1
                     self.wall_climb_timer = 0.0
-                    print(f"Pet {self.pet_id} started wall climbing on {side} wall")
+                    log.debug("Pet %s started wall climbing on %s wall", self.pet_id, side)
         else:
             # Regular wall bounce for non-climbing scenarios
             self.velocity_x *= -self.BOUNCE_COEFFICIENT
@@ -380,7 +661,7 @@ class DesktopPet:
     
     def _handle_corner_collision(self, wall_side: str) -> None:
         """Enhanced corner collision handling with direction lock to prevent glitches"""
-        print(f"Pet {self.pet_id} corner collision at {wall_side} wall")
+        log.debug("Pet %s corner collision at %s wall", self.pet_id, wall_side)
         
         # Lock direction changes to prevent glitches
         self._lock_direction(0.8)  # Lock for 0.8 seconds
@@ -394,22 +675,18 @@ class DesktopPet:
             self.facing_right = False
         
         # Update animation facing direction (invert for visual correction)
-        if self.animation_manager:
-            try:
-                self.animation_manager.set_facing_direction(not self.facing_right)
-            except Exception as e:
-                print(f"Error updating animation direction in corner collision: {e}")
+        self._anim_set_facing(not self.facing_right)
         
         # Use the movement system to start walking away from the wall
         # Set a target in the new direction (away from the wall)
         if self.boundary_manager:
-            playable = self.boundary_manager.get_playable_area()
+            bounds = self.boundary_manager
             if self.facing_right:
                 # Move right away from left wall
-                self.target_x = min(self.x + 120, playable['right'] - self.rect.width)
+                self.target_x = min(self.x + 120, bounds.right_wall_x - self.rect.width)
             else:
                 # Move left away from right wall
-                self.target_x = max(self.x - 120, playable['left'])
+                self.target_x = max(self.x - 120, bounds.left_wall_x)
         else:
             # Fallback movement
             if self.facing_right:
@@ -419,11 +696,11 @@ class DesktopPet:
         
         # Change to walking state
         self.change_state(PetState.WALKING)
-        print(f"Pet {self.pet_id} turning away from {wall_side} wall, direction locked for 0.8s")
+        log.debug("Pet %s turning away from %s wall, direction locked for 0.8s", self.pet_id, wall_side)
     
     def _handle_wall_turn_around(self, wall_side: str) -> None:
         """Enhanced wall turn around with direction lock to prevent glitches"""
-        print(f"Pet {self.pet_id} turned around at {wall_side} wall")
+        log.debug("Pet %s turned around at %s wall", self.pet_id, wall_side)
         
         # Lock direction changes to prevent glitches
         self._lock_direction(0.6)  # Lock for 0.6 seconds
@@ -440,13 +717,13 @@ class DesktopPet:
         # Use the movement system to start walking in the new direction
         # Set a target in the new direction (away from the wall)
         if self.boundary_manager:
-            playable = self.boundary_manager.get_playable_area()
+            bounds = self.boundary_manager
             if self.facing_right:
                 # Move right away from left wall
-                self.target_x = min(self.x + 150, playable['right'] - self.rect.width)
+                self.target_x = min(self.x + 150, bounds.right_wall_x - self.rect.width)
             else:
                 # Move left away from right wall
-                self.target_x = max(self.x - 150, playable['left'])
+                self.target_x = max(self.x - 150, bounds.left_wall_x)
         else:
             # Fallback movement
             if self.facing_right:
@@ -456,21 +733,21 @@ class DesktopPet:
         
         # Change to walking state to start movement
         self.change_state(PetState.WALKING)
-        print(f"Pet {self.pet_id} turned around at {wall_side} wall, direction locked for 0.6s")
+        log.debug("Pet %s turned around at %s wall, direction locked for 0.6s", self.pet_id, wall_side)
     
     def _handle_drag_wall_collision(self, side: str) -> None:
         """Handle wall collision while dragging - pet sticks to wall"""
         if not self.boundary_manager:
             return
         
-        boundaries = self.boundary_manager.boundaries
+        bounds = self.boundary_manager
         
         # Position pet exactly on the wall
         if side == 'left':
-            self.x = boundaries['left_wall_x']
+            self.x = bounds.left_wall_x
             self.facing_right = False  # Face toward left wall
         else:  # right
-            self.x = boundaries['right_wall_x'] - self.rect.width
+            self.x = bounds.right_wall_x - self.rect.width
             self.facing_right = True  # Face toward right wall
         
         # Set wall sticking state
@@ -482,22 +759,18 @@ class DesktopPet:
         self.velocity_y = 0
         
         # Update animation facing direction
-        if self.animation_manager:
-            try:
-                # Animation manager's set_facing_direction expects the visual direction
-                self.animation_manager.set_facing_direction(self.facing_right)
-            except:
-                pass
+        # Animation manager's set_facing_direction expects the visual direction
+        self._anim_set_facing(self.facing_right)
         
-        print(f"Pet {self.pet_id} stuck to {side} wall during drag")
+        log.debug("Pet %s stuck to %s wall during drag", self.pet_id, side)
     
     def _handle_ground_collision(self) -> None:
         """Handle ground collision"""
         if not self.boundary_manager:
             return
         
-        boundaries = self.boundary_manager.boundaries
-        self.y = boundaries['ground_y'] - self.rect.height
+        bounds = self.boundary_manager
+        self.y = bounds.ground_y - self.rect.height
         
         if abs(self.velocity_y) > self.MIN_BOUNCE_VELOCITY:
             self.velocity_y *= -self.BOUNCE_COEFFICIENT
@@ -506,7 +779,7 @@ class DesktopPet:
             self.velocity_y = 0
             self.on_ground = True
             self.on_wall = False
-            if self.state in [PetState.FALLING, PetState.THROWN, PetState.BOUNCING]:
+            if self.state in _FREEFALL_STATES:
                 self.change_state(PetState.IDLE)
     
     def _handle_ceiling_collision(self) -> None:
@@ -514,40 +787,35 @@ class DesktopPet:
         if not self.boundary_manager:
             return
         
-        boundaries = self.boundary_manager.boundaries
-        self.y = boundaries['ceiling_y']
+        bounds = self.boundary_manager
+        self.y = bounds.ceiling_y
         self.velocity_y = max(0, self.velocity_y)  # Stop upward movement
     
     def _update_movement_fallback(self, dt: float, screen_bounds: Tuple[int, int]) -> None:
         """Fallback movement system when boundary manager not available"""
         screen_width, screen_height = screen_bounds
         
-        # Apply gravity if enabled and not on ground
+        # Apply gravity and air resistance only if enabled and not on ground
         if self.gravity_enabled and not self.on_ground:
-            self.velocity_y += self.GRAVITY_ACCELERATION * dt
-            
-            # Apply air resistance
-            self.velocity_x *= (1 - self.AIR_RESISTANCE_FACTOR * dt)
-            self.velocity_y *= (1 - self.AIR_RESISTANCE_FACTOR * dt)
+            gravity = self.GRAVITY_ACCELERATION
+            damping = math.exp(self._air_decay_rate * dt)
+        else:
+            gravity = 0.0
+            damping = 1.0
         
-        # Update position
-        self.x += self.velocity_x * dt
-        self.y += self.velocity_y * dt
+        # Update velocity and position with the shared kernel
+        self.x, self.y, self.velocity_x, self.velocity_y = integrate_motion(
+            self.x, self.y, self.velocity_x, self.velocity_y, dt, gravity, damping
+        )
         
         # Basic screen boundary collision
-        if self.config.get('settings.screen_boundaries', True):
+        if self._screen_boundaries:
             # Horizontal boundaries
-            if self.x < 0:
-                self.x = 0
-                self.velocity_x *= -self.BOUNCE_COEFFICIENT
-                if abs(self.velocity_x) < self.MIN_BOUNCE_VELOCITY: 
-                    self.velocity_x = 0
-                self._change_direction()
-            elif self.x > screen_width - self.rect.width:
-                self.x = screen_width - self.rect.width
-                self.velocity_x *= -self.BOUNCE_COEFFICIENT
-                if abs(self.velocity_x) < self.MIN_BOUNCE_VELOCITY: 
-                    self.velocity_x = 0
+            self.x, self.velocity_x, hit = clamp_bounce(
+                self.x, self.velocity_x, 0.0, screen_width - self.rect.width,
+                self.BOUNCE_COEFFICIENT, self.MIN_BOUNCE_VELOCITY
+            )
+            if hit:
                 self._change_direction()
             
             # Ground collision
@@ -561,11 +829,11 @@ class DesktopPet:
                 else:
                     self.velocity_y = 0
                     self.on_ground = True
-                    if self.state in [PetState.FALLING, PetState.THROWN, PetState.BOUNCING]:
+                    if self.state in _FREEFALL_STATES:
                         self.change_state(PetState.IDLE)
             else:
                 self.on_ground = False
-                if self.state not in [PetState.DRAGGING, PetState.FALLING, PetState.THROWN, PetState.BOUNCING]:
+                if self.state is not PetState.DRAGGING and self.state not in _FREEFALL_STATES:
                     self.change_state(PetState.FALLING)
     
     def _update_fallback_animation(self, dt: float) -> None:
@@ -578,75 +846,49 @@ class DesktopPet:
             self.animation_timer = 0.0
             
             # Load different sprite based on state
-            if self.state == PetState.WALKING:
-                frame_sprites = ["shime2.png", "shime3.png"]
-            elif self.state == PetState.SITTING:
-                frame_sprites = ["shime11.png", "shime11a.png"]
-            elif self.state == PetState.RUNNING:
-                frame_sprites = ["shime3e.png", "shime3f.png"]
-            elif self.state in [PetState.FALLING, PetState.THROWN]:
-                frame_sprites = ["shime4.png", "shime4.png"]
-            elif self.state in [PetState.GRAB_WALL, PetState.CLIMB_WALL]:
-                frame_sprites = ["shime13.png", "shime13a.png"]  # Wall grab sprites
-            else:  # IDLE and other states
-                frame_sprites = ["shime1.png", "shime1a.png"]
-            
-            if self.animation_frame < len(frame_sprites):
-                new_sprite = frame_sprites[self.animation_frame]
-                if new_sprite != self.current_sprite_name:
-                    self.current_sprite_name = new_sprite
-                    self.image = self._load_current_sprite()
-                    
-                    # Flip sprite if facing left
-                    if not self.facing_right:
-                        self.image = pygame.transform.flip(self.image, True, False)
+            frame_sprites = _FALLBACK_FRAMES.get(self.state, _DEFAULT_FALLBACK_FRAMES)
+            new_sprite = frame_sprites[self.animation_frame]
+            if new_sprite != self.current_sprite_name:
+                self.current_sprite_name = new_sprite
+                self.image = self._load_current_sprite()
     
     def _update_state_behavior(self, dt: float) -> None:
         """Enhanced state behavior management with wall climbing"""
-        if self.state == PetState.IDLE:
-            if self.state_timer > 3.0:
+        if self.state is PetState.IDLE:
+            if self.state_timer > self.IDLE_DECISION_DELAY:
                 self._decide_next_action()
         
-        elif self.state in [PetState.WALKING, PetState.RUNNING]:
-            distance_to_target = abs(self.x - self.target_x)
-            animation_completed = True
-            
-            if self.animation_manager:
-                try:
-                    animation_completed = self.animation_manager.is_animation_completed()
-                except:
-                    animation_completed = True
-            
+        elif self.state in _MOVING_STATES:
             # Check if walk duration has expired (1-5 seconds)
-            walk_time_elapsed = self.state_timer - self.walk_start_time
-            if walk_time_elapsed >= self.walk_duration:
+            if self.state_timer >= self.walk_deadline:
                 self.velocity_x = 0
                 self.change_state(PetState.IDLE)
                 self.stats.walks_taken += 1
-                print(f"Pet {self.pet_id} finished walking after {walk_time_elapsed:.1f}s")
+                log.debug("Pet %s finished walking after %.1fs", self.pet_id, self.walk_duration)
                 return
             
             # Reduce speed as we approach target
+            distance_to_target = abs(self.x - self.target_x)
             if distance_to_target < 50:
                 self.velocity_x *= 0.9
             
-            if distance_to_target < 10 or animation_completed:
+            if distance_to_target < 10 or self._anim_is_completed():
                 self.velocity_x = 0
                 self.change_state(PetState.IDLE)
                 self.stats.walks_taken += 1
         
-        elif self.state == PetState.SITTING:
+        elif self.state is PetState.SITTING:
             # Sitting behavior - gradually restore energy
             self.stats.energy = min(100, self.stats.energy + 10 * dt)
             if self.state_timer > 5.0:  # Sit for 5 seconds
                 self.change_state(PetState.IDLE)
         
-        elif self.state == PetState.GRAB_WALL:
+        elif self.state is PetState.GRAB_WALL:
             # Wall grabbing - wait before climbing
             if self.state_timer > 1.0:  # Grab for 1 second
-                if self.config.get('boundaries.wall_climbing_enabled', True):
+                if self._wall_climbing_enabled:
                     self.change_state(PetState.CLIMB_WALL)
-                    print(f"Pet {self.pet_id} started climbing wall")
+                    log.debug("Pet %s started climbing wall", self.pet_id)
                 else:
                     # Fall off wall if climbing disabled
                     self.on_wall = False
@@ -654,7 +896,7 @@ class DesktopPet:
                     self.gravity_enabled = True
                     self.change_state(PetState.FALLING)
         
-        elif self.state == PetState.CLIMB_WALL:
+        elif self.state is PetState.CLIMB_WALL:
             # Enhanced wall climbing behavior with proper animation
             if self.on_wall and self.boundary_manager:
                 # Climb up slowly using animation velocity
@@ -663,27 +905,24 @@ class DesktopPet:
                 
                 # Update animation facing direction for wall climbing
                 if self.animation_manager:
-                    try:
-                        # For wall climbing, face away from the wall
-                        if self.wall_side == 'left':
-                            self.facing_right = True  # Face right when climbing left wall
-                        else:
-                            self.facing_right = False  # Face left when climbing right wall
-                        
-                        # Animation manager's set_facing_direction expects the visual direction
-                        self.animation_manager.set_facing_direction(self.facing_right)
-                    except Exception as e:
-                        print(f"Error updating wall climbing animation: {e}")
+                    # For wall climbing, face away from the wall
+                    if self.wall_side == 'left':
+                        self.facing_right = True  # Face right when climbing left wall
+                    else:
+                        self.facing_right = False  # Face left when climbing right wall
+                    
+                    # Animation manager's set_facing_direction expects the visual direction
+                    self._anim_set_facing(self.facing_right)
                 
                 # Check if reached top or should stop climbing
-                boundaries = self.boundary_manager.boundaries
-                if self.y <= boundaries['ceiling_y'] + 80:  # Near ceiling (increased threshold)
+                bounds = self.boundary_manager
+                if self.y <= bounds.ceiling_y + 80:  # Near ceiling (increased threshold)
                     # Transition to ceiling grab or fall
                     self.on_wall = False
                     self.wall_side = None
                     self.gravity_enabled = True
                     self.change_state(PetState.FALLING)
-                    print(f"Pet {self.pet_id} reached ceiling, falling")
+                    log.debug("Pet %s reached ceiling, falling", self.pet_id)
                 elif self.state_timer > 10.0:  # Climb for max 10 seconds (increased)
                     # Get tired and fall
                     self.on_wall = False
@@ -691,40 +930,35 @@ class DesktopPet:
                     self.gravity_enabled = True
                     self.velocity_y = 0  # Start falling gently
                     self.change_state(PetState.FALLING)
-                    print(f"Pet {self.pet_id} got tired, falling from wall")
+                    log.debug("Pet %s got tired, falling from wall", self.pet_id)
             else:
                 # Lost wall contact
                 self.on_wall = False
                 self.wall_side = None
                 self.gravity_enabled = True
                 self.change_state(PetState.FALLING)
-                print(f"Pet {self.pet_id} lost wall contact, falling")
+                log.debug("Pet %s lost wall contact, falling", self.pet_id)
         
-        elif self.state in [PetState.POSE, PetState.EAT_BERRY, PetState.THROW_NEEDLE, PetState.WATCH]:
+        elif self.state in _SPECIAL_STATES:
             # Special actions - wait for animation to complete
-            animation_completed = True
-            if self.animation_manager:
-                try:
-                    animation_completed = self.animation_manager.is_animation_completed()
-                except:
-                    animation_completed = True
+            animation_completed = self._anim_is_completed()
             
             if animation_completed or self.state_timer > 3.0:
                 self.change_state(PetState.IDLE)
-                if self.state != PetState.WATCH:
+                if self.state is not PetState.WATCH:
                     self.stats.special_actions_performed += 1
         
-        elif self.state in [PetState.FALLING, PetState.THROWN]:
+        elif self.state in _AIRBORNE_STATES:
             # While falling/thrown, ensure gravity is active
             self.gravity_enabled = True
         
-        elif self.state == PetState.BOUNCING:
+        elif self.state is PetState.BOUNCING:
             # Bounce state is brief
             if self.on_ground and abs(self.velocity_y) < self.MIN_BOUNCE_VELOCITY:
                 self.change_state(PetState.IDLE)
             self.gravity_enabled = True
 
-        elif self.state == PetState.DRAGGING:
+        elif self.state is PetState.DRAGGING:
             # While dragging, disable gravity and wall climbing
             self.gravity_enabled = False
             self.on_wall = False
@@ -732,132 +966,102 @@ class DesktopPet:
     
     def _update_behavioral_ai(self, dt: float) -> None:
         """Enhanced AI dengan wall climbing consideration"""
+        # Cheapest test first: most frames the next decision is not due yet
+        if self.behavior_timer <= self.BEHAVIOR_TICK_INTERVAL:
+            return
+        
         # Only make decisions when idle and on ground (or on wall)
-        if self.state != PetState.IDLE or (not self.on_ground and not self.on_wall):
+        if self.state is not PetState.IDLE or (not self.on_ground and not self.on_wall):
             return
         
         # Random behavior selection
-        if self.behavior_timer > 2.0:
-            self.behavior_timer = 0.0
-            
-            # Calculate behavior probabilities
-            energy_factor = self.stats.energy / 100.0
-            happiness_factor = self.stats.happiness / 100.0
-            activity_chance = (energy_factor + happiness_factor) / 2.0
-            
-            # Special wall climbing behavior
-            if self.on_wall and random.random() < 0.3:
-                # Continue climbing or fall off
-                if random.random() < 0.7:
-                    self.change_state(PetState.CLIMB_WALL)
-                else:
-                    self.on_wall = False
-                    self.wall_side = None
-                    self.gravity_enabled = True
-                    self.change_state(PetState.FALLING)
-                return
-            
-            if random.random() < activity_chance * 0.3:
-                self._decide_next_action()
+        self.behavior_timer = 0.0
+        
+        # Calculate behavior probabilities
+        energy_factor = self.stats.energy / 100.0
+        happiness_factor = self.stats.happiness / 100.0
+        activity_chance = (energy_factor + happiness_factor) / 2.0
+        
+        # Special wall climbing behavior
+        if self.on_wall and _random() < 0.3:
+            # Continue climbing or fall off
+            if _random() < 0.7:
+                self.change_state(PetState.CLIMB_WALL)
+            else:
+                self.on_wall = False
+                self.wall_side = None
+                self.gravity_enabled = True
+                self.change_state(PetState.FALLING)
+            return
+        
+        if _random() < activity_chance * 0.3:
+            self._decide_next_action()
     
     def _decide_next_action(self) -> None:
         """Enhanced action decision dengan wall climbing options"""
-        possible_actions = []
-        
-        # Basic movement actions
-        if self.stats.energy > 30:
-            possible_actions.extend([
-                (PetState.WALKING, 40),
-                (PetState.RUNNING, 20),
-            ])
-        
-        # Rest actions
-        if self.stats.energy < 70:
-            possible_actions.extend([
-                (PetState.SITTING, 30),
-            ])
-        
-        # Special actions
-        if self.stats.happiness > 50:
-            possible_actions.extend([
-                (PetState.POSE, 15),
-                (PetState.EAT_BERRY, 10),
-                (PetState.WATCH, 20),
-            ])
-        
         # Wall climbing actions (if near boundary walls)
-        if self.boundary_manager and self.config.get('boundaries.wall_climbing_enabled', True):
-            boundaries = self.boundary_manager.boundaries
-            near_left_wall = abs(self.x - boundaries['left_wall_x']) < 50
-            near_right_wall = abs(self.x - boundaries['right_wall_x']) < 50
-            
-            if near_left_wall or near_right_wall:
-                possible_actions.extend([
-                    (PetState.GRAB_WALL, 25),  # Higher chance near walls
-                ])
-        
-        # Random special actions
-        if random.random() < 0.1:
-            possible_actions.extend([
-                (PetState.THROW_NEEDLE, 5),
-            ])
-        
-        if possible_actions:
-            # Weighted random selection
-            total_weight = sum(weight for _, weight in possible_actions)
-            random_value = random.randint(1, total_weight)
-            
-            current_weight = 0
-            for action, weight in possible_actions:
-                current_weight += weight
-                if random_value <= current_weight:
-                    if action in [PetState.WALKING, PetState.RUNNING]:
-                        self._start_movement(action)
-                    elif action == PetState.GRAB_WALL:
-                        self._start_wall_climbing()
-                    else:
-                        self.change_state(action)
-                    break
+        near_wall = False
+        if self.boundary_manager and self._wall_climbing_enabled:
+            bounds = self.boundary_manager
+            near_wall = (abs(self.x - bounds.left_wall_x) < 50 or
+                         abs(self.x - bounds.right_wall_x) < 50)
+        
+        # Pick precomputed table for current conditions (see _ACTION_WEIGHT_GROUPS)
+        states, prob, aliases = _ACTION_TABLES[(
+            self.stats.energy > 30,
+            self.stats.energy < 70,
+            self.stats.happiness > 50,
+            near_wall,
+            _random() < 0.1,
+        )]
+        
+        if states:
+            # Weighted random selection (alias method, O(1) per decision)
+            i = int(_random() * len(states))
+            action = states[i] if _random() < prob[i] else aliases[i]
+            if action in _MOVING_STATES:
+                self._start_movement(action)
+            elif action is PetState.GRAB_WALL:
+                self._start_wall_climbing()
+            else:
+                self.change_state(action)
     
     def _start_movement(self, movement_type: PetState) -> None:
         """Start movement dengan target random dan wall-aware direction selection"""
         # Set random walk duration between 1-5 seconds
-        self.walk_duration = random.uniform(1.0, 5.0)
+        self.walk_duration = _uniform(1.0, 5.0)
         self.walk_start_time = self.state_timer
+        self.walk_deadline = self.walk_start_time + self.walk_duration
         
         if self.boundary_manager:
             # Use boundary-aware movement with wall proximity detection
-            playable = self.boundary_manager.get_playable_area()
-            boundaries = self.boundary_manager.boundaries
-            max_distance = 300 if movement_type == PetState.RUNNING else 150
+            bounds = self.boundary_manager
+            max_distance = 300 if movement_type is PetState.RUNNING else 150
             
             # Check proximity to walls for direction bias
-            left_distance = abs(self.x - boundaries['left_wall_x'])
-            right_distance = abs(self.x - boundaries['right_wall_x'])
+            left_distance = abs(self.x - bounds.left_wall_x)
+            right_distance = abs(self.x - bounds.right_wall_x)
             wall_proximity_threshold = 100  # Distance to consider "near wall"
             
-            # Determine direction with wall bias
+            # Determine direction with wall bias: chance to go right, 2x away from a near wall
             if left_distance < wall_proximity_threshold:
-                # Near left wall - bias towards right (2x probability)
-                direction = 1 if random.random() < 0.67 else -1
-                print(f"Pet {self.pet_id} near left wall, biased towards right")
+                right_chance = 0.67
             elif right_distance < wall_proximity_threshold:
-                # Near right wall - bias towards left (2x probability)
-                direction = -1 if random.random() < 0.67 else 1
-                print(f"Pet {self.pet_id} near right wall, biased towards left")
+                right_chance = 0.33
             else:
-                # Not near walls - random direction
-                direction = random.choice([-1, 1])
+                right_chance = 0.5
+            direction = 1 if _random() < right_chance else -1
             
-            distance = random.randint(50, max_distance)
+            # Uniform integer in [50, max_distance], same range as randint
+            distance = 50 + int((max_distance - 49) * _random())
             self.target_x = self.x + (distance * direction)
             # Clamp to playable area
-            self.target_x = max(playable['left'], min(playable['right'] - self.rect.width, self.target_x))
+            self.target_x = max(bounds.left_wall_x, min(bounds.right_wall_x - self.rect.width, self.target_x))
         else:
             # Fallback movement (no wall detection)
-            max_distance = 300 if movement_type == PetState.RUNNING else 150
-            direction = random.choice([-1, 1])
-            distance = random.randint(50, max_distance)
+            max_distance = 300 if movement_type is PetState.RUNNING else 150
+            direction = 1 if _random() < 0.5 else -1
+            distance = 50 + int((max_distance - 49) * _random())
             self.target_x = self.x + (distance * direction)
             self.target_x = max(0.0, min(1920.0, self.target_x))
         
@@ -865,15 +1069,11 @@ class DesktopPet:
         self.facing_right = self.target_x > self.x
         
         # Update animation facing direction (invert for visual correction)
-        if self.animation_manager:
-            try:
-                self.animation_manager.set_facing_direction(not self.facing_right)
-            except:
-                pass
+        self._anim_set_facing(not self.facing_right)
         
         # Debug: Log the actual direction and target
         direction_text = "right" if self.facing_right else "left"
-        print(f"Pet {self.pet_id} starting {movement_type.value} for {self.walk_duration:.1f}s towards {direction_text} (target_x: {self.target_x:.1f}, current_x: {self.x:.1f})")
+        log.debug("Pet %s starting %s for %.1fs towards %s (target_x: %.1f, current_x: %.1f)", self.pet_id, movement_type.value, self.walk_duration, direction_text, self.target_x, self.x)
         self.change_state(movement_type)
     
     def _start_wall_climbing(self) -> None:
@@ -881,36 +1081,32 @@ class DesktopPet:
         if not self.boundary_manager:
             return
         
-        boundaries = self.boundary_manager.boundaries
+        bounds = self.boundary_manager
         
         # Determine which wall to climb
-        left_distance = abs(self.x - boundaries['left_wall_x'])
-        right_distance = abs(self.x - boundaries['right_wall_x'])
+        left_distance = abs(self.x - bounds.left_wall_x)
+        right_distance = abs(self.x - bounds.right_wall_x)
         
         if left_distance < right_distance:
             # Move to left wall
-            self.target_x = boundaries['left_wall_x']
+            self.target_x = bounds.left_wall_x
             self.wall_side = 'left'
             self.facing_right = False
         else:
             # Move to right wall
-            self.target_x = boundaries['right_wall_x'] - self.rect.width
+            self.target_x = bounds.right_wall_x - self.rect.width
             self.wall_side = 'right'
             self.facing_right = True
         
         # Update animation facing direction (invert for visual correction)
-        if self.animation_manager:
-            try:
-                self.animation_manager.set_facing_direction(not self.facing_right)
-            except:
-                pass
+        self._anim_set_facing(not self.facing_right)
         
         # Start walking to wall
         self.change_state(PetState.WALKING)
     
     def _change_direction(self) -> None:
         """Enhanced direction change with cooldown to prevent glitches"""
-        current_time = time.time()
+        current_time = self.last_update_time  # Shared frame timestamp from update()
         
         # Check if enough time has passed since last direction change
         if current_time - self.last_direction_change < self.direction_change_cooldown:
@@ -925,13 +1121,9 @@ class DesktopPet:
         self.last_direction_change = current_time
         
         # Update animation facing direction
-        if self.animation_manager:
-            try:
-                self.animation_manager.set_facing_direction(not self.facing_right)  
-            except Exception as e:
-                print(f"Error updating animation direction: {e}")
+        self._anim_set_facing(not self.facing_right)
         
-        print(f"Pet {self.pet_id} changed direction to {'right' if self.facing_right else 'left'}")
+        log.debug("Pet %s changed direction to %s", self.pet_id, 'right' if self.facing_right else 'left')
     
     def _lock_direction(self, duration: float = None) -> None:
         """Lock direction changes for a specified duration"""
@@ -942,110 +1134,122 @@ class DesktopPet:
     
     def _update_stats(self, dt: float) -> None:
         """Enhanced stats management"""
+        # Hitung di local lalu tulis balik sekali (satu load/store per field per frame)
+        stats = self.stats
+        state = self.state
+        
         # Gradually decrease happiness and energy over time
-        self.stats.happiness = max(0, self.stats.happiness - 0.5 * dt)
-        self.stats.energy = max(0, self.stats.energy - 0.3 * dt)
+        happiness = max(0, stats.happiness - 0.5 * dt)
+        energy = max(0, stats.energy - 0.3 * dt)
         
         # Restore energy when sitting, idle, or wall climbing
-        if self.state in [PetState.SITTING, PetState.IDLE, PetState.GRAB_WALL]:
-            self.stats.energy = min(100, self.stats.energy + 0.5 * dt)
-        
+        if state in _RESTING_STATES:
+            energy = min(100, energy + 0.5 * dt)
         # Wall climbing uses energy
-        if self.state == PetState.CLIMB_WALL:
-            self.stats.energy = max(0, self.stats.energy - 1.0 * dt)
+        elif state is PetState.CLIMB_WALL:
+            energy = max(0, energy - 1.0 * dt)
         
         # Restore happiness with interactions
-        time_since_interaction = time.time() - self.stats.last_interaction
-        if time_since_interaction < 10:
-            self.stats.happiness = min(100, self.stats.happiness + 1 * dt)
+        if self.last_update_time - stats.last_interaction < 10:
+            happiness = min(100, happiness + 1 * dt)
+        
+        stats.happiness = happiness
+        stats.energy = energy
     
     def change_state(self, new_state: PetState) -> None:
         """Enhanced state changing dengan wall climbing integration"""
-        if new_state != self.state:
+        if new_state is not self.state:
             self.previous_state = self.state
             self.state = new_state
             self.state_timer = 0.0
             
-            print(f"Pet {self.pet_id} changed state: {self.previous_state.value} -> {new_state.value}")
+            log.debug("Pet %s changed state: %s -> %s", self.pet_id, self.previous_state.value, new_state.value)
             
             # Start appropriate animation
-            if self.animation_manager:
-                try:
-                    loop_animation = new_state in [PetState.IDLE, PetState.WALKING, 
-                                                 PetState.RUNNING, PetState.SITTING,
-                                                 PetState.GRAB_WALL, PetState.GRAB_CEILING,
-                                                 PetState.CLIMB_WALL, PetState.BOUNCING]
-                    self.animation_manager.play_action(new_state.value, loop=loop_animation)
-                except Exception as e:
-                    print(f"Error starting animation for {new_state.value}: {e}")
+            self._anim_play(new_state.value, loop=new_state in _LOOPING_STATES)
             
-            # State-specific initialization
-            if new_state == PetState.SITTING:
-                self.velocity_x = 0
-                self.velocity_y = 0
-                self.gravity_enabled = False
-                self.on_ground = True
-                self.on_wall = False
-            elif new_state in [PetState.FALLING, PetState.THROWN]:
-                self.on_ground = False
-                self.on_wall = False
-                self.gravity_enabled = True
-            elif new_state == PetState.DRAGGING:
-                self.velocity_x = 0
-                self.velocity_y = 0
-                self.gravity_enabled = False
-                self.on_ground = False
-                self.on_wall = False
-            elif new_state == PetState.BOUNCING:
-                self.on_ground = False
-                self.on_wall = False
-                self.gravity_enabled = True
-            elif new_state == PetState.IDLE:
-                self.velocity_x = 0
-                self.velocity_y = 0
-                if not self.on_wall:
-                    self.on_ground = True
-                    self.gravity_enabled = True
-            elif new_state in [PetState.GRAB_WALL, PetState.CLIMB_WALL]:
-                # Enhanced wall climbing states with proper animation
-                self.on_ground = False
-                self.gravity_enabled = False
-                self.velocity_x = 0
-                self.velocity_y = 0
-                
-                # Lock direction changes during wall climbing to prevent glitches
-                self._lock_direction(2.0)  # Lock for 2 seconds during wall climbing
-                
-                # Set proper facing direction for wall climbing
-                if self.wall_side == 'left':
-                    self.facing_right = False  # Face left (toward left wall)
-                elif self.wall_side == 'right':
-                    self.facing_right = True  # Face right (toward right wall)
-                
-                # Update animation facing direction (animation manager uses opposite logic)
-                if self.animation_manager:
-                    try:
-                        # For wall climbing, we want the sprite to face away from the wall
-                        # Animation manager's set_facing_direction expects the visual direction
-                        self.animation_manager.set_facing_direction(self.facing_right)
-                        print(f"Pet {self.pet_id} wall climbing animation direction set to {'right' if self.facing_right else 'left'}")
-                    except Exception as e:
-                        print(f"Error setting wall climbing animation direction: {e}")
-                
-                print(f"Pet {self.pet_id} entered {new_state.value} state with direction lock")
-            elif new_state in [PetState.WALKING, PetState.RUNNING]:
-                # Initialize walk duration tracking
-                if not hasattr(self, 'walk_duration') or self.walk_duration == 0.0:
-                    self.walk_duration = random.uniform(1.0, 5.0)
-                    self.walk_start_time = self.state_timer
+            # State-specific initialization (satu dict lookup, lihat _STATE_INIT)
+            init = self._STATE_INIT.get(new_state)
+            if init is not None:
+                init(self)
+    
+    def _init_sitting(self) -> None:
+        """Masuk SITTING: diam di tanah"""
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.gravity_enabled = False
+        self.on_ground = True
+        self.on_wall = False
+    
+    def _init_airborne(self) -> None:
+        """Masuk FALLING/THROWN/BOUNCING: lepas dari tanah dan dinding, gravity aktif"""
+        self.on_ground = False
+        self.on_wall = False
+        self.gravity_enabled = True
+    
+    def _init_dragging(self) -> None:
+        """Masuk DRAGGING: posisi diatur mouse, physics berhenti"""
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.gravity_enabled = False
+        self.on_ground = False
+        self.on_wall = False
+    
+    def _init_idle(self) -> None:
+        """Masuk IDLE: berhenti, tetap menempel jika sedang di dinding"""
+        self.velocity_x = 0
+        self.velocity_y = 0
+        if not self.on_wall:
+            self.on_ground = True
+            self.gravity_enabled = True
+    
+    def _init_wall(self) -> None:
+        """Masuk GRAB_WALL/CLIMB_WALL: enhanced wall climbing states with proper animation"""
+        self.on_ground = False
+        self.gravity_enabled = False
+        self.velocity_x = 0
+        self.velocity_y = 0
+        
+        # Lock direction changes during wall climbing to prevent glitches
+        self._lock_direction(2.0)  # Lock for 2 seconds during wall climbing
+        
+        # Set proper facing direction for wall climbing
+        if self.wall_side == 'left':
+            self.facing_right = False  # Face left (toward left wall)
+        elif self.wall_side == 'right':
+            self.facing_right = True  # Face right (toward right wall)
+        
+        # Update animation facing direction (animation manager uses opposite logic)
+        # For wall climbing, we want the sprite to face away from the wall
+        # Animation manager's set_facing_direction expects the visual direction
+        self._anim_set_facing(self.facing_right)
+        log.debug("Pet %s wall climbing animation direction set to %s", self.pet_id, 'right' if self.facing_right else 'left')
+        
+        log.debug("Pet %s entered %s state with direction lock", self.pet_id, self.state.value)
+    
+    def _init_moving(self) -> None:
+        """Masuk WALKING/RUNNING: initialize walk duration tracking"""
+        if self.walk_duration == 0.0:
+            self.walk_duration = _uniform(1.0, 5.0)
+            self.walk_start_time = self.state_timer
+            self.walk_deadline = self.walk_start_time + self.walk_duration
+    
+    # State-specific initialization untuk change_state; state tanpa entry tidak perlu init
+    _STATE_INIT = {
+        PetState.SITTING: _init_sitting,
+        PetState.DRAGGING: _init_dragging,
+        PetState.IDLE: _init_idle,
+        PetState.BOUNCING: _init_airborne,
+        **dict.fromkeys(_AIRBORNE_STATES, _init_airborne),
+        **dict.fromkeys(_WALL_STATES, _init_wall),
+        **dict.fromkeys(_MOVING_STATES, _init_moving),
+    }
     
     def handle_mouse_down(self, pos: Tuple[int, int], button: int) -> str:
         """Enhanced mouse handling"""
         if not self.rect.collidepoint(pos):
             return "none"
         
-        current_time = pygame.time.get_ticks()
-        
         if button == 1:  # Left click
             self.dragging = True
             self.drag_offset_x = pos[0] - self.rect.x
@@ -1053,7 +1257,7 @@ class DesktopPet:
             self.change_state(PetState.DRAGGING)
             
             # Update interaction stats
-            self.stats.last_interaction = time.time()
+            self.stats.last_interaction = time.monotonic()
             self.stats.total_interactions += 1
             self.stats.times_petted += 1
             self.stats.happiness = min(100, self.stats.happiness + 10)
@@ -1061,6 +1265,8 @@ class DesktopPet:
             return "drag_start"
         
         elif button == 3:  # Right click
+            current_time = pygame.time.get_ticks()
+            
             # Double right-click detection
             if current_time - self.last_click_time < AppConstants.DOUBLE_CLICK_TIMEOUT:
                 self.stop()  # Mark pet as not running
@@ -1068,13 +1274,14 @@ class DesktopPet:
             else:
                 self.last_click_time = current_time
                 # Single right-click actions
-                if self.state != PetState.SITTING:
+                if self.state is not PetState.SITTING:
                     self.change_state(PetState.SITTING)
                 else:
                     # Cycle through special actions
-                    special_actions = [PetState.POSE, PetState.EAT_BERRY, PetState.WATCH, PetState.THROW_NEEDLE]
-                    if self.boundary_manager and self.config.get('boundaries.wall_climbing_enabled', True):
-                        special_actions.append(PetState.GRAB_WALL)
+                    if self.boundary_manager and self._wall_climbing_enabled:
+                        special_actions = self._SPECIAL_ACTIONS_WITH_WALL
+                    else:
+                        special_actions = self._SPECIAL_ACTIONS
                     
                     chosen_action = random.choice(special_actions)
                     self.change_state(chosen_action)
@@ -1092,15 +1299,19 @@ class DesktopPet:
                 self.on_wall = False
                 self.wall_side = None
                 self.gravity_enabled = True
-                print(f"Pet {self.pet_id} released from wall")
+                log.debug("Pet %s released from wall", self.pet_id)
             
             # Apply throw velocity
             self.velocity_x = mouse_dx * self.DRAG_THROW_MULTIPLIER
             self.velocity_y = mouse_dy * self.DRAG_THROW_MULTIPLIER
             
+            # change_state(THROWN) already clears on_ground and enables gravity
             self.change_state(PetState.THROWN)
-            self.on_ground = False
-            self.gravity_enabled = True
+            if self.on_ground or not self.gravity_enabled:
+                # Misalnya sudah THROWN (change_state no-op); paksa airborne
+                log.warning("Pet %s thrown while grounded, forcing airborne", self.pet_id)
+                self.on_ground = False
+                self.gravity_enabled = True
             
             return "drag_end"
         
@@ -1109,70 +1320,87 @@ class DesktopPet:
     def handle_mouse_motion(self, pos: Tuple[int, int]) -> None:
         """Enhanced mouse motion handling with wall collision prevention"""
         if self.dragging:
-            new_x = float(pos[0] - self.drag_offset_x)
-            new_y = float(pos[1] - self.drag_offset_y)
+            # Mouse pos, drag offset, rect dan boundary semuanya int: clamp di int, float sekali di akhir
+            new_x = pos[0] - self.drag_offset_x
+            new_y = pos[1] - self.drag_offset_y
             
             # Check if new position would cross wall boundaries
             if self.boundary_manager:
-                boundaries = self.boundary_manager.boundaries
+                bounds = self.boundary_manager
+                width, height = self.rect.size
                 
                 # Prevent crossing left wall
-                if new_x < boundaries['left_wall_x']:
-                    new_x = boundaries['left_wall_x']
+                if new_x < bounds.left_wall_x:
+                    new_x = bounds.left_wall_x
                     # Trigger wall sticking
                     if not self.on_wall:
                         self._handle_drag_wall_collision('left')
                 
                 # Prevent crossing right wall
-                elif new_x + self.rect.width > boundaries['right_wall_x']:
-                    new_x = boundaries['right_wall_x'] - self.rect.width
+                elif new_x + width > bounds.right_wall_x:
+                    new_x = bounds.right_wall_x - width
                     # Trigger wall sticking
                     if not self.on_wall:
                         self._handle_drag_wall_collision('right')
                 
                 # Prevent crossing ground
-                if new_y + self.rect.height > boundaries['ground_y']:
-                    new_y = boundaries['ground_y'] - self.rect.height
+                if new_y + height > bounds.ground_y:
+                    new_y = bounds.ground_y - height
                 
                 # Prevent crossing ceiling
-                if new_y < boundaries['ceiling_y']:
-                    new_y = boundaries['ceiling_y']
+                if new_y < bounds.ceiling_y:
+                    new_y = bounds.ceiling_y
             
             # Update position
-            self.x = new_x
-            self.y = new_y
+            self.x = float(new_x)
+            self.y = float(new_y)
             
             self.target_x = self.x
             self.target_y = self.y
     
     def handle_speech(self, text: str, duration: float = 10.0) -> None:
         """Handle speech bubble display (enhanced for Phase 2)"""
-        print(f"Pet {self.pet_id} says: {text}")
+        log.debug("Pet %s says: %s", self.pet_id, text)
         # TODO: Implement speech bubble system dalam Phase 2
         
         # Update happiness when receiving speech
         self.stats.happiness = min(100, self.stats.happiness + 5)
-        self.stats.last_interaction = time.time()
+        self.stats.last_interaction = time.monotonic()
     
     def trigger_special_action(self, action_name: str) -> bool:
         """Trigger special action dari external command"""
-        try:
-            special_state = PetState(action_name)
-            if special_state != self.state:
-                self.change_state(special_state)
-                return True
-        except ValueError:
-            print(f"Unknown action: {action_name}")
+        special_state = _STATE_BY_VALUE.get(action_name)
+        if special_state is None:
+            log.warning("Unknown action: %s", action_name)
+        elif special_state is not self.state:
+            self.change_state(special_state)
+            return True
         return False
     
+    def _get_animation_info(self, animation_manager: Optional['AnimationManager']) -> Dict[str, Any]:
+        """Info animasi saat ini, di-cache sampai action/frame/state animasi berubah"""
+        if animation_manager is None:
+            return {}
+        try:
+            token = animation_manager.get_state_token()
+            cache = self._anim_info_cache
+            if cache is not None and cache[0] == token:
+                animation_info = cache[1]
+                if 'frame_timer' in animation_info:
+                    animation_info['frame_timer'] = animation_manager.current_animation.frame_timer
+            else:
+                animation_info = animation_manager.get_current_animation_info()
+                self._anim_info_cache = (token, animation_info)
+        except (AttributeError, RuntimeError) as e:
+            log.debug("Animation info unavailable for %s: %s", self.pet_id, e)
+            return {'error': 'animation_manager_error'}
+        return animation_info
+    
     def get_state_info(self) -> Dict[str, Any]:
         """Enhanced state information dengan boundary info"""
-        animation_info = {}
-        if self.animation_manager:
-            try:
-                animation_info = self.animation_manager.get_current_animation_info()
-            except:
-                animation_info = {'error': 'animation_manager_error'}
+        animation_manager = self.animation_manager
+        # Dict animasi di-cache per pet, jadi caller dapat salinan sendiri
+        animation_info = dict(self._get_animation_info(animation_manager))
         
         return {
             'pet_id': self.pet_id,
@@ -1201,38 +1429,15 @@ class DesktopPet:
                 'time_in_state': self.stats.time_in_current_state
             },
             'animation': animation_info,
-            'animation_system': self.animation_manager is not None
+            'animation_system': animation_manager is not None
         }
     
     def save_state(self) -> Dict[str, Any]:
         """Enhanced state persistence dengan boundary info"""
-        return {
-            'pet_id': self.pet_id,
-            'sprite_name': self.sprite_name,
-            'x': self.x,
-            'y': self.y,
-            'target_x': self.target_x,
-            'target_y': self.target_y,
-            'state': self.state.value,
-            'facing_right': self.facing_right,
-            'velocity_x': self.velocity_x,
-            'velocity_y': self.velocity_y,
-            'on_ground': self.on_ground,
-            'on_wall': self.on_wall,
-            'wall_side': self.wall_side,
-            'gravity_enabled': self.gravity_enabled,
-            'running': self.running,
-            'stats': {
-                'health': self.stats.health,
-                'happiness': self.stats.happiness,
-                'energy': self.stats.energy,
-                'total_interactions': self.stats.total_interactions,
-                'walks_taken': self.stats.walks_taken,
-                'times_petted': self.stats.times_petted,
-                'special_actions_performed': self.stats.special_actions_performed,
-                            'wall_climbs': self.stats.wall_climbs
-            }
-        }
+        state_data = {field: getattr(self, field) for field in self._SAVE_FIELDS}
+        state_data['state'] = self.state.value
+        state_data['stats'] = {field: getattr(self.stats, field) for field in self._STATS_FIELDS}
+        return state_data
     
     @classmethod
     def load_from_state(cls, state_data: Dict[str, Any]) -> 'DesktopPet':
@@ -1256,10 +1461,7 @@ class DesktopPet:
         pet.gravity_enabled = state_data.get('gravity_enabled', True)
         
         # Restore state
-        try:
-            pet.change_state(PetState(state_data['state']))
-        except ValueError:
-            pet.change_state(PetState.IDLE)
+        pet.change_state(_STATE_BY_VALUE.get(state_data['state'], PetState.IDLE))
         
         # Restore running status
         pet.running = state_data.get('running', True)
@@ -1276,11 +1478,7 @@ class DesktopPet:
         pet.stats.wall_climbs = stats_data.get('wall_climbs', 0)
         
         # Update animation facing direction (invert for visual correction)
-        if pet.animation_manager:
-            try:
-                pet.animation_manager.set_facing_direction(not pet.facing_right)
-            except:
-                pass
+        pet._anim_set_facing(not pet.facing_right)
         
         return pet
     
@@ -1288,26 +1486,67 @@ class DesktopPet:
         """Enhanced drawing dengan boundary-aware debug info"""
         if self.image:
             screen.blit(self.image, self.rect)
-        else:
+        self.draw_overlays(screen)
+    
+    def draw_overlays(self, screen: pygame.Surface) -> None:
+        """Draw semua selain sprite (fallback rect dan debug info)
+        
+        Dipisah dari draw() supaya renderer bisa batch blit sprite semua pet.
+        """
+        if not self.image:
             # Fallback drawing
             pygame.draw.rect(screen, (255, 100, 100), self.rect)
         
         # Debug information
-        if self.config.get('settings.debug_mode', False):
+        if self._debug:
             self._draw_debug_info(screen)
         
         # Stats overlay (only when debug mode is active)
-        if self.config.get('settings.debug_mode', False) and self.config.get('settings.show_stats', False):
+        if self._debug and self._show_stats:
             self._draw_stats_overlay(screen)
     
+    @classmethod
+    def _get_font(cls, size: int) -> pygame.font.Font:
+        """Get cached default font untuk ukuran tertentu"""
+        font = cls._FONTS.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            cls._FONTS[size] = font
+        return font
+    
+    @classmethod
+    def _get_state_label(cls, state: PetState, size: int) -> pygame.Surface:
+        """Get cached rendered state name (jumlah state terbatas, jadi cache tidak tumbuh)"""
+        key = (state, size)
+        label = cls._STATE_LABELS.get(key)
+        if label is None:
+            label = cls._get_font(size).render(state.value, True, (255, 255, 255))
+            cls._STATE_LABELS[key] = label
+        return label
+    
+    @classmethod
+    def _render_text(cls, text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text dengan cache (FIFO) untuk label yang jarang berubah, di-share antar pet"""
+        key = (text, size, color)
+        surface = cls._TEXT_CACHE.get(key)
+        if surface is None:
+            if len(cls._TEXT_CACHE) >= cls.TEXT_CACHE_SIZE:
+                del cls._TEXT_CACHE[next(iter(cls._TEXT_CACHE))]
+            surface = cls._get_font(size).render(text, True, color)
+            cls._TEXT_CACHE[key] = surface
+        return surface
+    
     def _draw_debug_info(self, screen: pygame.Surface) -> None:
         """Enhanced debug information dengan boundary info"""
+        rect = self.rect
+        x, y = rect.topleft
+        
         # Draw bounding box
-        pygame.draw.rect(screen, (255, 0, 0), self.rect, 1)
+        pygame.draw.rect(screen, (255, 0, 0), rect, 1)
         
         # Draw velocity vector
         scale_factor = 0.1 
-        start_pos = (self.rect.centerx, self.rect.centery)
+        start_pos = rect.center
         end_pos = (
             int(start_pos[0] + self.velocity_x * scale_factor),
             int(start_pos[1] + self.velocity_y * scale_factor)
@@ -1320,15 +1559,14 @@ class DesktopPet:
             pygame.draw.rect(screen, (0, 0, 255), target_rect)
         
         # Draw state text
-        font = pygame.font.Font(None, 20)
-        state_text = font.render(f"{self.state.value}", True, (255, 255, 255))
-        screen.blit(state_text, (self.rect.x, self.rect.y - 25))
+        font = DesktopPet._get_font(20)
+        screen.blit(DesktopPet._get_state_label(self.state, 20), (x, y - 25))
         
         # Draw wall climbing indicator
         if self.on_wall:
             wall_color = (255, 255, 0)  # Yellow for wall climbing
-            wall_indicator = font.render(f"WALL-{self.wall_side.upper()}", True, wall_color)
-            screen.blit(wall_indicator, (self.rect.x, self.rect.y - 50))
+            wall_indicator = self._render_text("WALL-%s" % self.wall_side.upper(), 20, wall_color)
+            screen.blit(wall_indicator, (x, y - 50))
         
         # Draw facing direction indicator (consisten dengan visual direction)
         # Arrow harus menunjukkan arah visual yang sebenarnya dari sprite
@@ -1342,58 +1580,65 @@ class DesktopPet:
                 visual_facing_right = True  # Sprite menghadap kanan (ke dinding kanan)
         
         if visual_facing_right:
-            pygame.draw.polygon(screen, (255, 255, 0), [
-                (self.rect.right - 10, self.rect.top + 5),
-                (self.rect.right - 5, self.rect.top + 10),
-                (self.rect.right - 10, self.rect.top + 15)
-            ])
+            base_x, offsets = rect.right, self._ARROW_RIGHT
         else:
-            pygame.draw.polygon(screen, (255, 255, 0), [
-                (self.rect.left + 10, self.rect.top + 5),
-                (self.rect.left + 5, self.rect.top + 10),
-                (self.rect.left + 10, self.rect.top + 15)
-            ])
+            base_x, offsets = x, self._ARROW_LEFT
+        pygame.draw.polygon(screen, (255, 255, 0), [(base_x + dx, y + dy) for dx, dy in offsets])
         
         # Display velocity values
-        velocity_text = font.render(f"Vel: ({self.velocity_x:.0f}, {self.velocity_y:.0f})", True, (255, 255, 255))
-        screen.blit(velocity_text, (self.rect.x, self.rect.y - 75))
+        velocity_text = font.render("Vel: (%.0f, %.0f)" % (self.velocity_x, self.velocity_y), True, (255, 255, 255))
+        screen.blit(velocity_text, (x, y - 75))
         
         # Display boundary status
         status_indicators = []
         if self.on_ground:
             status_indicators.append("GND")
         if self.on_wall:
-            status_indicators.append(f"WALL-{self.wall_side.upper()}")
+            status_indicators.append("WALL-%s" % self.wall_side.upper())
         if self.gravity_enabled:
             status_indicators.append("GRAV")
         
         if status_indicators:
-            status_text = font.render(" | ".join(status_indicators), True, (0, 255, 255))
-            screen.blit(status_text, (self.rect.x, self.rect.y - 100))
+            status_text = self._render_text(" | ".join(status_indicators), 20, (0, 255, 255))
+            screen.blit(status_text, (x, y - 100))
 
     def _draw_stats_overlay(self, screen: pygame.Surface) -> None:
         """Enhanced stats overlay dengan boundary stats"""
-        font = pygame.font.Font(None, 16)
-        y_offset = 0
-        
+        # Re-compose only when a displayed (rounded) value changes
+        key = (round(self.stats.health), round(self.stats.happiness), round(self.stats.energy),
+               self.state, self.stats.wall_climbs)
+        if key != self._stats_overlay_key:
+            self._stats_overlay_surf = self._compose_stats_overlay()
+            self._stats_overlay_key = key
+        
+        screen.blit(self._stats_overlay_surf, (self.rect.x - 60, self.rect.y))
+    
+    def _compose_stats_overlay(self) -> pygame.Surface:
+        """Render semua baris stats ke satu surface"""
+        font = DesktopPet._get_font(16)
         stats_info = [
-            f"Health: {self.stats.health:.0f}",
-            f"Happy: {self.stats.happiness:.0f}",
-            f"Energy: {self.stats.energy:.0f}",
-            f"State: {self.state.value}",
-            f"Climbs: {self.stats.wall_climbs}",
+            "Health: %.0f" % self.stats.health,
+            "Happy: %.0f" % self.stats.happiness,
+            "Energy: %.0f" % self.stats.energy,
+            "State: %s" % self.state.value,
+            "Climbs: %d" % self.stats.wall_climbs,
         ]
+        text_surfaces = [font.render(stat_text, True, (255, 255, 255)) for stat_text in stats_info]
+        
+        width = max(text_surface.get_width() for text_surface in text_surfaces)
+        overlay = pygame.Surface((width, 18 * len(text_surfaces)), pygame.SRCALPHA)
         
-        for stat_text in stats_info:
-            text_surface = font.render(stat_text, True, (255, 255, 255))
+        y_offset = 0
+        for text_surface in text_surfaces:
             # Draw background
             bg_rect = text_surface.get_rect()
-            bg_rect.x = self.rect.x - 60
-            bg_rect.y = self.rect.y + y_offset
-            pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
+            bg_rect.y = y_offset
+            overlay.fill((0, 0, 0, 255), bg_rect)
             # Draw text
-            screen.blit(text_surface, (self.rect.x - 60, self.rect.y + y_offset))
+            overlay.blit(text_surface, (0, y_offset))
             y_offset += 18
+        
+        return overlay
     
     def get_available_actions(self) -> List[str]:
         """Get list semua action yang tersedia"""
@@ -1406,45 +1651,42 @@ class DesktopPet:
     
     def get_performance_info(self) -> Dict[str, Any]:
         """Get performance information untuk debugging"""
-        animation_info = {}
-        if self.animation_manager:
-            try:
-                animation_info = self.animation_manager.get_current_animation_info()
-            except:
-                animation_info = {'error': 'animation_manager_error'}
+        # Snapshot sekali supaya hasil konsisten walau animation_manager di-reset di tengah jalan
+        animation_manager = self.animation_manager
+        animation_info = self._get_animation_info(animation_manager)
         
         return {
+            **self._PERFORMANCE_TEMPLATE,
             'pet_id': self.pet_id,
             'sprite_name': self.sprite_name,
-            'animation_system_loaded': self.animation_manager is not None,
+            'animation_system_loaded': animation_manager is not None,
             'boundary_system_connected': self.boundary_manager is not None,
-            'current_animation': animation_info,
+            'current_animation': dict(animation_info),
             'wall_climbing_stats': {
                 'on_wall': self.on_wall,
                 'wall_side': self.wall_side,
                 'total_climbs': self.stats.wall_climbs
             },
-            'update_frequency': '30 FPS target',
-            'memory_footprint': 'Light (sprites cached)'
         }
     
     def stop(self) -> None:
         """Stop the pet (mark as not running)"""
         self.running = False
-        print(f"Pet {self.pet_id} stopped")
+        log.debug("Pet %s stopped", self.pet_id)
     
     def cleanup(self) -> None:
         """Enhanced cleanup"""
-        print(f"Cleaning up enhanced pet: {self.pet_id}")
+        log.debug("Cleaning up enhanced pet: %s", self.pet_id)
         
         # Mark as not running
         self.running = False
         
         # Stop any running animations
-        if self.animation_manager:
+        animation_manager = self.animation_manager
+        if animation_manager is not None:
             try:
-                self.animation_manager.stop_current_animation()
-            except:
+                animation_manager.stop_current_animation()
+            except (AttributeError, RuntimeError):
                 pass
         
         # Clear boundary manager reference
@@ -1452,4 +1694,5 @@ class DesktopPet:
         
         # Clear references
         self.animation_manager = None
+        self._bind_animation_hooks()
         self.current_sprite = None
\ No newline at end of file
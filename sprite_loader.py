@@ -7,6 +7,7 @@ with validation and error handling. Fixed circular import issues.
 """
 
 import os
+import functools
 import pygame
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
@@ -107,11 +108,35 @@ class SpriteDiscovery:
         return validation_results
 
 
+def convert_for_display(surface: pygame.Surface) -> pygame.Surface:
+    """Convert surface ke pixel format display (blit jauh lebih cepat)
+    
+    Returns surface apa adanya jika display mode belum di-set (headless/tests).
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    try:
+        return surface.convert_alpha()
+    except pygame.error:
+        return surface
+
+
+@functools.lru_cache(maxsize=256)
+def canonical_sprite_name(sprite_name: str) -> str:
+    """Normalisasi nama sprite pack untuk cache key ("Hornet " -> "Hornet")
+    
+    Nama sprite pack adalah nama folder: hanya whitespace yang dibuang. Case dan
+    suffix bertitik ("Shimeji v1.2") tetap dipertahankan supaya tiap folder punya key sendiri.
+    """
+    return sprite_name.strip()
+
+
 class SpriteLoader:
     """Sprite loading and caching system"""
     
     def __init__(self):
         self._sprite_cache: Dict[str, pygame.Surface] = {}
+        self._flipped_cache: Dict[str, pygame.Surface] = {}
         self._fallback_sprite: Optional[pygame.Surface] = None
     
     def load_sprite(self, sprite_name: str, filename: str) -> pygame.Surface:
@@ -127,32 +152,44 @@ class SpriteLoader:
         
         try:
             if os.path.exists(sprite_path):
-                # Load image without convert first (to avoid display init error)
                 surface = pygame.image.load(sprite_path)
                 
-                # Try to convert with alpha if display is initialized
-                try:
-                    if pygame.get_init():
-                        surface = surface.convert_alpha()
-                except pygame.error:
-                    # Display not initialized yet, use as-is
-                    pass
+                # Sebelum display mode di-set surface belum bisa di-convert; jangan di-cache
+                # supaya load berikutnya (setelah window dibuat) dapat versi converted
+                if pygame.display.get_surface() is None:
+                    return surface
                 
+                surface = convert_for_display(surface)
                 self._sprite_cache[cache_key] = surface
                 return surface
             else:
                 print(f"Sprite file not found: {sprite_path}")
-                return self._get_fallback_sprite()
+                return self.get_fallback_sprite()
                 
         except pygame.error as e:
             print(f"Error loading sprite {sprite_path}: {e}")
-            return self._get_fallback_sprite()
+            return self.get_fallback_sprite()
+    
+    def load_sprite_flipped(self, sprite_name: str, filename: str) -> pygame.Surface:
+        """Load a horizontally flipped sprite (flip hanya dilakukan sekali)"""
+        cache_key = f"{sprite_name}:{filename}"
+        
+        flipped = self._flipped_cache.get(cache_key)
+        if flipped is None:
+            flipped = pygame.transform.flip(self.load_sprite(sprite_name, filename), True, False)
+            if pygame.display.get_surface() is not None:
+                self._flipped_cache[cache_key] = flipped
+        
+        return flipped
     
-    def _get_fallback_sprite(self) -> pygame.Surface:
-        """Get fallback sprite for missing images"""
+    def get_fallback_sprite(self) -> pygame.Surface:
+        """Get fallback sprite for missing images (dibuat sekali, lalu di-share)"""
         if self._fallback_sprite is None:
-            self._fallback_sprite = pygame.Surface(AppConstants.DEFAULT_SPRITE_SIZE, pygame.SRCALPHA)
-            self._fallback_sprite.fill((255, 100, 100, 200))  # Semi-transparent red
+            fallback = pygame.Surface(AppConstants.DEFAULT_SPRITE_SIZE, pygame.SRCALPHA)
+            fallback.fill((255, 100, 100, 200))  # Semi-transparent red
+            if pygame.display.get_surface() is None:
+                return fallback  # Belum bisa di-convert, jangan di-cache
+            self._fallback_sprite = convert_for_display(fallback)
         
         return self._fallback_sprite
     
@@ -213,6 +250,7 @@ class SpriteLoader:
     def clear_cache(self) -> None:
         """Clear sprite cache to free memory"""
         self._sprite_cache.clear()
+        self._flipped_cache.clear()
         print("Sprite cache cleared")
     
     def get_cache_info(self) -> Dict[str, int]:
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+test_action_tables.py - Weighted action table test
+
+Verifies that the precomputed alias tables used by _decide_next_action
+give every action exactly its configured share of the total weight.
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pet_behavior import _ACTION_TABLES, _ACTION_WEIGHT_GROUPS
+
+
+def test_alias_tables_match_weights():
+    """Alias table probability mass should equal weight / total weight"""
+    print("=== Testing Action Alias Tables ===")
+
+    for key, (states, prob, aliases) in _ACTION_TABLES.items():
+        weights = {}
+        for enabled, group in zip(key, _ACTION_WEIGHT_GROUPS):
+            if enabled:
+                weights.update(group)
+
+        if not weights:
+            assert states == ()
+            continue
+
+        n = len(states)
+        mass = dict.fromkeys(states, 0.0)
+        for i in range(n):
+            mass[states[i]] += prob[i] / n
+            mass[aliases[i]] += (1.0 - prob[i]) / n
+
+        total = sum(weights.values())
+        for state, weight in weights.items():
+            assert abs(mass[state] - weight / total) < 1e-9, (
+                f"{state.value} in {key}: {mass[state]:.4f} != {weight / total:.4f}")
+
+    print(f"✅ {len(_ACTION_TABLES)} tables match their weights")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_alias_tables_match_weights()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+test_idle_rest_skip.py - Resting pet update test
+
+Verifies that an idle pet standing on the ground skips the physics pass
+while it waits, and still wakes up once its next decision is due.
+"""
+
+import sys
+import os
+import pygame
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import get_config
+from pet_behavior import DesktopPet, PetState
+from gui_manager import BoundaryManager
+
+
+def _create_resting_pet() -> DesktopPet:
+    """Create a pet standing still on the ground in the middle of the screen"""
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+
+    boundary_manager = BoundaryManager(1920, 1080, get_config())
+    pet = DesktopPet("Hornet", x=900, y=100)
+    pet.set_boundary_manager(boundary_manager)
+    pet.y = boundary_manager.boundaries['ground_y'] - pet.rect.height
+    pet.change_state(PetState.IDLE)
+    return pet
+
+
+def test_resting_pet_skips_physics():
+    """Idle pet on the ground should not run the movement pass"""
+    print("=== Testing Resting Pet Update ===")
+
+    pet = _create_resting_pet()
+    movement_calls = []
+    original_movement = pet._update_movement_with_boundaries
+    pet._update_movement_with_boundaries = lambda dt, bounds: (
+        movement_calls.append(dt), original_movement(dt, bounds))
+
+    start_position = (pet.x, pet.y)
+
+    # One second of frames stays well inside both decision timers
+    for _ in range(30):
+        pet.update(1 / 30.0, (1920, 1080))
+
+    print(f"Movement calls while resting: {len(movement_calls)}")
+    print(f"Position: {start_position} -> {(pet.x, pet.y)}")
+
+    assert len(movement_calls) == 0, "Resting pet should skip the movement pass"
+    assert (pet.x, pet.y) == start_position, "Resting pet should not move"
+    assert pet.state == PetState.IDLE
+
+    print("✅ Resting pet skipped physics")
+    return True
+
+
+def test_resting_pet_wakes_up():
+    """Resting pet should still pick a new action once the idle delay expires"""
+    print("=== Testing Resting Pet Wake Up ===")
+
+    pet = _create_resting_pet()
+
+    frames = int((DesktopPet.IDLE_DECISION_DELAY + 0.5) * 30)
+    for _ in range(frames):
+        pet.update(1 / 30.0, (1920, 1080))
+        if pet.state != PetState.IDLE:
+            break
+
+    print(f"State after idle delay: {pet.state.value}")
+    assert pet.state != PetState.IDLE, "Pet should leave IDLE after the decision delay"
+
+    print("✅ Resting pet woke up")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_resting_pet_skips_physics() and test_resting_pet_wakes_up()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+test_sprite_cache.py - Sprite cache display test
+
+Verifies that sprites loaded before the display mode is set are not
+cached, so the first load after the window exists caches a converted
+surface instead of the raw one, that shared animation assets built
+before the window exists are rebuilt once it does, and that sprite packs
+with dotted folder names get their own asset.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import pygame
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import AppConstants
+from sprite_loader import SpriteLoader
+from utils.animation import get_animation_asset, clear_animation_assets
+
+
+def test_sprites_loaded_before_display_are_not_cached():
+    """Load before set_mode should not pin the unconverted surface"""
+    print("=== Testing Sprite Cache Before Display ===")
+
+    assets_dir = tempfile.mkdtemp()
+    os.makedirs(os.path.join(assets_dir, "Test"))
+    image = pygame.Surface((8, 8), pygame.SRCALPHA)
+    pygame.image.save(image, os.path.join(assets_dir, "Test", "shime1.png"))
+
+    original_assets_dir = AppConstants.ASSETS_DIR
+    AppConstants.ASSETS_DIR = assets_dir
+    try:
+        pygame.display.quit()
+        pygame.init()
+        loader = SpriteLoader()
+
+        loader.load_sprite("Test", "shime1.png")
+        loader.load_sprite_flipped("Test", "shime1.png")
+        print(f"Cached before display: {len(loader._sprite_cache)}")
+        assert not loader._sprite_cache, "Unconverted sprite must not be cached"
+        assert not loader._flipped_cache
+
+        pygame.display.set_mode((800, 600))
+        first = loader.load_sprite("Test", "shime1.png")
+        assert loader.load_sprite("Test", "shime1.png") is first
+        print(f"Cached after display: {len(loader._sprite_cache)}")
+    finally:
+        AppConstants.ASSETS_DIR = original_assets_dir
+
+    print("✅ Sprite cached only once the display exists")
+    return True
+
+
+def test_animation_asset_rebuilt_after_display():
+    """Asset built headless should be replaced once the window exists"""
+    print("=== Testing Animation Asset Before Display ===")
+
+    pygame.display.quit()
+    pygame.init()
+    clear_animation_assets()
+
+    early = get_animation_asset("Hornet")
+    assert early.loaded and not early.display_ready
+
+    pygame.display.set_mode((800, 600))
+    rebuilt = get_animation_asset("Hornet")
+    print(f"Rebuilt after display: {rebuilt is not early}")
+    assert rebuilt is not early, "Headless asset must be rebuilt with converted frames"
+    assert rebuilt.display_ready
+    assert get_animation_asset("Hornet") is rebuilt
+
+    print("✅ Animation asset rebuilt once the display exists")
+    return True
+
+
+def test_dotted_pack_names_get_separate_assets():
+    """"Pack v1.2" and "Pack v1.3" are different folders, not one pack"""
+    print("=== Testing Dotted Sprite Pack Names ===")
+
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    hornet_conf = os.path.join(project_root, AppConstants.ASSETS_DIR, "Hornet", AppConstants.XML_CONFIG_DIR)
+    assets_dir = tempfile.mkdtemp()
+    for pack_name in ("Pack v1.2", "Pack v1.3"):
+        shutil.copytree(hornet_conf, os.path.join(assets_dir, pack_name, AppConstants.XML_CONFIG_DIR))
+
+    original_assets_dir = AppConstants.ASSETS_DIR
+    AppConstants.ASSETS_DIR = assets_dir
+    try:
+        pygame.init()
+        pygame.display.set_mode((800, 600))
+        clear_animation_assets()
+
+        first = get_animation_asset("Pack v1.2")
+        second = get_animation_asset("Pack v1.3")
+        print(f"Assets: {first.sprite_name!r}, {second.sprite_name!r}")
+        assert first is not second, "Dotted pack names must not share one asset"
+        assert first.sprite_name == "Pack v1.2"
+        assert second.sprite_name == "Pack v1.3"
+        assert get_animation_asset(" Pack v1.2 ") is first
+    finally:
+        AppConstants.ASSETS_DIR = original_assets_dir
+        clear_animation_assets()
+
+    print("✅ Dotted sprite packs kept separate")
+    return True
+
+
+if __name__ == "__main__":
+    success = (test_sprites_loaded_before_display_are_not_cached()
+               and test_animation_asset_rebuilt_after_display()
+               and test_dotted_pack_names_get_separate_assets())
+    sys.exit(0 if success else 1)
@@ -9,11 +9,13 @@ Fixed all circular import issues.
 
 import pygame
 import time
+import threading
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
 from config import get_config
+from sprite_loader import canonical_sprite_name, get_sprite_loader
 from utils.xml_parser import XMLParser, ActionData, AnimationData, PoseData
 
 
@@ -34,12 +36,66 @@ class AnimationFrame:
     anchor_point: Tuple[int, int]
     sound_file: Optional[str] = None
     volume: Optional[int] = None
+    flipped_surface: Optional[pygame.Surface] = None  # Dibuat saat pertama kali dibutuhkan
+
+
+def _create_fallback_frame() -> AnimationFrame:
+    """Create fallback frame when sprite loading fails"""
+    fallback_surface = pygame.Surface((128, 128), pygame.SRCALPHA)
+    fallback_surface.fill((255, 100, 100, 200))
+    return AnimationFrame(
+        sprite_surface=fallback_surface,
+        duration=1.0,
+        velocity=(0, 0),
+        anchor_point=(64, 128)
+    )
+
+
+def build_animation_frames(animation_data: AnimationData, sprite_name: str,
+                           sprite_loader) -> List[AnimationFrame]:
+    """Membangun frame animasi dari pose data"""
+    if not sprite_loader:
+        print("Warning: No sprite loader available, creating fallback frame")
+        return [_create_fallback_frame()]
+    
+    frames = []
+    for pose in animation_data.poses:
+        try:
+            # Load sprite surface
+            sprite_surface = sprite_loader.load_sprite(sprite_name, pose.image)
+            
+            # Convert duration dari frame count ke detik (asumsi 30 FPS)
+            duration_seconds = pose.duration / 30.0
+            
+            # Convert velocity dari pixels/frame ke pixels/second
+            velocity = (pose.velocity[0] * 30, pose.velocity[1] * 30)
+            
+            frames.append(AnimationFrame(
+                sprite_surface=sprite_surface,
+                duration=duration_seconds,
+                velocity=velocity,
+                anchor_point=pose.image_anchor,
+                sound_file=pose.sound,
+                volume=pose.volume
+            ))
+            
+        except Exception as e:
+            print(f"Error loading frame for pose {pose.image}: {e}")
+            continue
+    
+    if frames:
+        print(f"Built {len(frames)} frames for animation")
+    else:
+        print(f"Warning: No frames built for animation, creating fallback")
+        frames.append(_create_fallback_frame())
+    return frames
 
 
 class Animation:
     """Kelas untuk mengelola sequence animasi tunggal"""
     
-    def __init__(self, animation_data: AnimationData, sprite_name: str):
+    def __init__(self, animation_data: AnimationData, sprite_name: str,
+                 frames: Optional[List[AnimationFrame]] = None):
         self.animation_data = animation_data
         self.sprite_name = sprite_name
         self.frames: List[AnimationFrame] = []
@@ -48,77 +104,34 @@ class Animation:
         self.state = AnimationState.STOPPED
         self.loop = True
         self.facing_right = True
+        self.state_version = 0  # Naik setiap kali frame atau state berubah
         
-        # Create sprite loader instance directly
-        self.sprite_loader = self._create_sprite_loader()
         self.config = get_config()
         
+        # Frame dari AnimationAsset dipakai bersama (read-only), tidak perlu load ulang
+        if frames is not None:
+            self.sprite_loader = None
+            self.frames = frames
+            return
+        
+        # Shared sprite loader (surface di-cache global)
+        self.sprite_loader = self._create_sprite_loader()
+        
         # Build frames dari pose data
         self._build_frames()
     
     def _create_sprite_loader(self):
-        """Create sprite loader instance safely"""
+        """Get shared sprite loader instance safely"""
         try:
-            from sprite_loader import SpriteLoader
-            return SpriteLoader()
+            from sprite_loader import get_sprite_loader
+            return get_sprite_loader()
         except Exception as e:
             print(f"Error creating sprite loader: {e}")
             return None
     
     def _build_frames(self) -> None:
         """Membangun frame animasi dari pose data"""
-        self.frames.clear()
-        
-        if not self.sprite_loader:
-            print("Warning: No sprite loader available, creating fallback frame")
-            self._create_fallback_frame()
-            return
-        
-        for pose in self.animation_data.poses:
-            try:
-                # Load sprite surface
-                sprite_surface = self.sprite_loader.load_sprite(
-                    self.sprite_name, pose.image
-                )
-                
-                # Convert duration dari frame count ke detik (asumsi 30 FPS)
-                duration_seconds = pose.duration / 30.0
-                
-                # Convert velocity dari pixels/frame ke pixels/second
-                velocity = (pose.velocity[0] * 30, pose.velocity[1] * 30)
-                
-                frame = AnimationFrame(
-                    sprite_surface=sprite_surface,
-                    duration=duration_seconds,
-                    velocity=velocity,
-                    anchor_point=pose.image_anchor,
-                    sound_file=pose.sound,
-                    volume=pose.volume
-                )
-                
-                self.frames.append(frame)
-                
-            except Exception as e:
-                print(f"Error loading frame for pose {pose.image}: {e}")
-                continue
-        
-        if len(self.frames) > 0:
-            print(f"Built {len(self.frames)} frames for animation")
-        else:
-            print(f"Warning: No frames built for animation, creating fallback")
-            self._create_fallback_frame()
-    
-    def _create_fallback_frame(self):
-        """Create fallback frame when sprite loading fails"""
-        fallback_surface = pygame.Surface((128, 128), pygame.SRCALPHA)
-        fallback_surface.fill((255, 100, 100, 200))
-        fallback_frame = AnimationFrame(
-            sprite_surface=fallback_surface,
-            duration=1.0,
-            velocity=(0, 0),
-            anchor_point=(64, 128)
-        )
-        self.frames.append(fallback_frame)
+        self.frames = build_animation_frames(self.animation_data, self.sprite_name, self.sprite_loader)
     
     def start(self, loop: bool = True) -> None:
         """Mulai animasi"""
@@ -126,22 +139,26 @@ class Animation:
         self.current_frame_index = 0
         self.frame_timer = 0.0
         self.state = AnimationState.PLAYING
+        self.state_version += 1
     
     def stop(self) -> None:
         """Stop animasi"""
         self.state = AnimationState.STOPPED
         self.current_frame_index = 0
         self.frame_timer = 0.0
+        self.state_version += 1
     
     def pause(self) -> None:
         """Pause animasi"""
         if self.state == AnimationState.PLAYING:
             self.state = AnimationState.PAUSED
+            self.state_version += 1
     
     def resume(self) -> None:
         """Resume animasi"""
         if self.state == AnimationState.PAUSED:
             self.state = AnimationState.PLAYING
+            self.state_version += 1
     
     def update(self, dt: float) -> Tuple[pygame.Surface, Tuple[float, float]]:
         """Update animasi dan return current sprite + velocity"""
@@ -149,7 +166,7 @@ class Animation:
             # Return first frame sebagai default
             if self.frames:
                 frame = self.frames[0]
-                sprite = self._get_flipped_sprite(frame.sprite_surface)
+                sprite = self._get_flipped_sprite(frame)
                 return sprite, frame.velocity
             else:
                 # Ultimate fallback sprite
@@ -165,6 +182,7 @@ class Animation:
         if self.frame_timer >= current_frame.duration:
             self.frame_timer = 0.0
             self.current_frame_index += 1
+            self.state_version += 1
             
             # Check if animation completed
             if self.current_frame_index >= len(self.frames):
@@ -180,14 +198,16 @@ class Animation:
         
         # Return current frame data
         current_frame = self.frames[self.current_frame_index]
-        sprite = self._get_flipped_sprite(current_frame.sprite_surface)
+        sprite = self._get_flipped_sprite(current_frame)
         return sprite, current_frame.velocity
     
-    def _get_flipped_sprite(self, sprite: pygame.Surface) -> pygame.Surface:
-        """Get sprite dengan flip horizontal jika facing left"""
-        if not self.facing_right:
-            return pygame.transform.flip(sprite, True, False)
-        return sprite
+    def _get_flipped_sprite(self, frame: AnimationFrame) -> pygame.Surface:
+        """Get sprite dengan flip horizontal jika facing left (hasil flip di-cache per frame)"""
+        if self.facing_right:
+            return frame.sprite_surface
+        if frame.flipped_surface is None:
+            frame.flipped_surface = pygame.transform.flip(frame.sprite_surface, True, False)
+        return frame.flipped_surface
     
     def _play_sound(self, sound_file: str, volume: Optional[int]) -> None:
         """Play sound effect using sound manager"""
@@ -219,34 +239,96 @@ class Animation:
         }
 
 
-class AnimationManager:
-    """Manager untuk mengelola multiple animasi dan transisi state"""
+class AnimationAsset:
+    """Data animasi satu sprite pack (XML + frame), dibangun sekali dan dipakai bersama semua pet
+    
+    Frame di sini read-only; state playback per pet ada di Animation/AnimationManager.
+    """
     
     def __init__(self, sprite_name: str):
         self.sprite_name = sprite_name
         self.xml_parser = XMLParser()
-        self.animations: Dict[str, Animation] = {}
-        self.current_animation: Optional[Animation] = None
-        self.current_action_name = ""
+        self.animations: Dict[str, Tuple[AnimationData, List[AnimationFrame]]] = {}
+        self.loaded = False
+        # Frame yang dibangun sebelum display ada belum di-convert (lihat is_current)
+        self.display_ready = pygame.display.get_surface() is not None
         
-        # Load XML data
-        self._load_animations()
+        self._load()
     
-    def _load_animations(self) -> None:
-        """Load semua animasi dari XML"""
-        success = self.xml_parser.parse_sprite_pack(self.sprite_name)
-        if not success:
+    def _load(self) -> None:
+        """Parse XML dan bangun frame untuk semua animasi"""
+        if not self.xml_parser.parse_sprite_pack(self.sprite_name):
             print(f"Failed to parse XML for sprite pack: {self.sprite_name}")
             return
         
-        # Build animations dari action data
+        sprite_loader = get_sprite_loader()
+        
         actions = self.xml_parser.get_all_actions()
         for action_name, action_data in actions.items():
             for i, animation_data in enumerate(action_data.animations):
                 # Create unique key untuk setiap animasi dalam action
                 anim_key = f"{action_name}_{i}" if len(action_data.animations) > 1 else action_name
-                animation = Animation(animation_data, self.sprite_name)
-                self.animations[anim_key] = animation
+                frames = build_animation_frames(animation_data, self.sprite_name, sprite_loader)
+                self.animations[anim_key] = (animation_data, frames)
+        
+        self.loaded = True
+        print(f"Built animation asset for {self.sprite_name}: {len(self.animations)} animations")
+    
+    def is_current(self) -> bool:
+        """Asset bisa dipakai ulang: loaded, dan tidak dibangun sebelum display mode di-set"""
+        return self.loaded and (self.display_ready or pygame.display.get_surface() is None)
+
+
+# Shared animation assets per sprite pack
+_animation_assets: Dict[str, AnimationAsset] = {}
+_animation_assets_lock = threading.Lock()
+
+def get_animation_asset(sprite_name: str) -> AnimationAsset:
+    """Get shared AnimationAsset untuk sprite pack (dibangun saat pertama diminta)
+    
+    Asset yang gagal load atau dibangun sebelum window ada dibangun ulang.
+    File I/O dilakukan di luar lock supaya load satu pack tidak memblokir pack lain.
+    """
+    sprite_key = canonical_sprite_name(sprite_name)
+    with _animation_assets_lock:
+        asset = _animation_assets.get(sprite_key)
+    if asset is not None and asset.is_current():
+        return asset
+    
+    asset = AnimationAsset(sprite_key)  # Build dari nama yang sama dengan key
+    with _animation_assets_lock:
+        current = _animation_assets.get(sprite_key)
+        if current is not None and current.is_current():
+            return current  # Thread lain sudah selesai lebih dulu
+        _animation_assets[sprite_key] = asset
+    return asset
+
+def clear_animation_assets() -> None:
+    """Hapus semua shared animation asset (misalnya setelah sprite pack berubah)"""
+    with _animation_assets_lock:
+        _animation_assets.clear()
+
+
+class AnimationManager:
+    """Manager untuk mengelola multiple animasi dan transisi state"""
+    
+    def __init__(self, sprite_name: str):
+        self.sprite_name = sprite_name
+        self.asset = get_animation_asset(sprite_name)
+        self.xml_parser = self.asset.xml_parser
+        self.animations: Dict[str, Animation] = {}
+        self.current_animation: Optional[Animation] = None
+        self.current_action_name = ""
+        self._play_count = 0
+        self._fallback_surface: Optional[pygame.Surface] = None
+        
+        # Build animasi per pet dari shared asset
+        self._load_animations()
+    
+    def _load_animations(self) -> None:
+        """Buat player animasi per pet di atas frame dari shared asset"""
+        for anim_key, (animation_data, frames) in self.asset.animations.items():
+            self.animations[anim_key] = Animation(animation_data, self.sprite_name, frames=frames)
         
         print(f"Loaded {len(self.animations)} animations for {self.sprite_name}")
     
@@ -256,14 +338,16 @@ class AnimationManager:
             print(f"Animation not found: {action_name}")
             return False
         
-        # Stop current animation
-        if self.current_animation:
+        # Stop current animation (start() already resets the same animation)
+        animation = self.animations[action_name]
+        if self.current_animation and self.current_animation is not animation:
             self.current_animation.stop()
         
         # Start new animation
-        self.current_animation = self.animations[action_name]
+        self.current_animation = animation
         self.current_action_name = action_name
-        self.current_animation.start(loop)
+        self._play_count += 1
+        animation.start(loop)
         
         return True
     
@@ -272,10 +356,11 @@ class AnimationManager:
         if self.current_animation:
             return self.current_animation.update(dt)
         else:
-            # No animation playing, return fallback
-            fallback = pygame.Surface((128, 128), pygame.SRCALPHA)
-            fallback.fill((100, 255, 100, 200))  # Green fallback
-            return fallback, (0, 0)
+            # No animation playing, return fallback (dibuat sekali saja)
+            if self._fallback_surface is None:
+                self._fallback_surface = pygame.Surface((128, 128), pygame.SRCALPHA)
+                self._fallback_surface.fill((100, 255, 100, 200))  # Green fallback
+            return self._fallback_surface, (0, 0)
     
     def set_facing_direction(self, facing_right: bool) -> None:
         """Set facing direction untuk semua animasi"""
@@ -301,6 +386,12 @@ class AnimationManager:
         frame_info['action_name'] = self.current_action_name
         return frame_info
     
+    def get_state_token(self) -> Tuple[int, int]:
+        """Token yang berubah setiap kali action, frame, atau state animasi berubah"""
+        if not self.current_animation:
+            return (self._play_count, -1)
+        return (self._play_count, self.current_animation.state_version)
+    
     def stop_current_animation(self) -> None:
         """Stop animasi saat ini"""
         if self.current_animation:
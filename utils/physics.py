@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+utils/physics.py - Pet Physics Kernels
+
+Fungsi scalar murni untuk integrasi gerak dan pantulan boundary.
+Di-compile dengan numba jika tersedia, tanpa numba tetap jalan
+sebagai Python biasa.
+"""
+
+from typing import Tuple
+
+# Optional JIT untuk physics kernel - tanpa numba pakai pure Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator: return function apa adanya"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Boundary collision bitmask (lihat boundary_contacts)
+HIT_LEFT_WALL = 1
+HIT_RIGHT_WALL = 2
+HIT_GROUND = 4
+HIT_CEILING = 8
+HIT_WALLS = HIT_LEFT_WALL | HIT_RIGHT_WALL
+
+
+@njit(cache=True)
+def integrate_motion(x: float, y: float, vx: float, vy: float, dt: float,
+                     gravity: float, damping: float) -> Tuple[float, float, float, float]:
+    """Satu langkah integrasi fisika: gravity, air resistance, lalu posisi
+
+    Pure scalar function tanpa akses ke object, jadi bisa dipakai ulang
+    oleh semua jalur movement. Pass gravity=0.0 / damping=1.0 untuk skip.
+    """
+    vy += gravity * dt
+    vx *= damping
+    vy *= damping
+    return x + vx * dt, y + vy * dt, vx, vy
+
+
+@njit(cache=True)
+def clamp_bounce(pos: float, vel: float, low: float, high: float,
+                 bounce: float, min_bounce: float) -> Tuple[float, float, int]:
+    """Clamp satu axis ke [low, high] dan pantulkan velocity
+
+    Returns (pos, vel, hit) dengan hit -1 (kena low), 1 (kena high), atau 0.
+    Velocity pantulan di bawah min_bounce dihentikan.
+    """
+    if pos < low:
+        pos = low
+        hit = -1
+    elif pos > high:
+        pos = high
+        hit = 1
+    else:
+        return pos, vel, 0
+
+    vel *= -bounce
+    if abs(vel) < min_bounce:
+        vel = 0.0
+    return pos, vel, hit
+
+
+@njit(cache=True)
+def boundary_contacts(x: float, y: float, width: float, height: float,
+                      left: float, right: float, ceiling: float, ground: float) -> int:
+    """Bitmask HIT_* untuk boundary yang disentuh rectangle"""
+    mask = 0
+    if x <= left:
+        mask |= HIT_LEFT_WALL
+    if x + width >= right:
+        mask |= HIT_RIGHT_WALL
+    if y + height >= ground:
+        mask |= HIT_GROUND
+    if y <= ceiling:
+        mask |= HIT_CEILING
+    return mask